@@ -1,3 +1,4 @@
+import importlib
 import logging
 
 from .attributes import DynoAttrBase, DynoAttrBool, DynoAttrByteList, DynoAttrBytes, DynoAttribAutoIncrement
@@ -5,7 +6,6 @@ from .attributes import DynoAttrDateTime, DynoEnum, DynoAttrFlag, DynoAttrFloat
 from .attributes import DynoAttrFloatList, DynoAttrInt, DynoAttrIntList, DynoAttrList
 from .attributes import DynoAttrIntEnum, DynoAttrStrEnum
 from .attributes import DynoAttrMap, DynoAttrString, DynoAttrStringList, DynoAttrUuid
-from .connects import DynoConnect, DynoResponse
 from .filtering import DynoFilter, DynoFilterKey, DynoOpEnum
 from .reading import DynoReader
 from .table import DynoGlobalIndex, DynoKey, DynoKeyFormat, DynoSchema, DynoTable, DynoTableLink
@@ -20,6 +20,25 @@ except ImportError:
 
 logger = logging.getLogger("tussik.dyno")
 
+# modules that pull in boto3 are only imported on first use
+_LAZY_IMPORTS = {
+    "DynoConnect": ".connects",
+    "DynoResponse": ".connects",
+}
+
+
+def __getattr__(name: str) -> any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 __version__ = ""  # importlib_metadata.version(__name__)
 
 __all__ = [
@@ -1,7 +1,11 @@
 import datetime
 import logging
+import sys
+import time
 import uuid
+from contextvars import ContextVar
 from enum import Enum
+from types import MappingProxyType
 from typing import Self
 
 logger = logging.getLogger()
@@ -23,6 +27,15 @@ class DynoEnum(str, Enum):
     def get_datatype(cls, value: any) -> None | Self:
         if value is None:
             return cls.Null
+        # exact builtin types resolve with one lookup, subclasses fall through to the checks below
+        vtype = type(value)
+        if vtype is list and len(value) > 0:
+            datatype = _LIST_DATATYPES.get(type(value[0]))
+        else:
+            datatype = _DATATYPES.get(vtype)
+        if datatype is not None:
+            return datatype
+
         if isinstance(value, str):
             return cls.String
         if isinstance(value, bool):
@@ -34,6 +47,8 @@ class DynoEnum(str, Enum):
         if isinstance(value, dict):
             return cls.Map
         if isinstance(value, list):
+            if len(value) == 0:
+                return None
             row = value[0]
             if isinstance(row, str):
                 return cls.StringList
@@ -46,6 +61,37 @@ class DynoEnum(str, Enum):
         return None
 
 
+_DATATYPES = {
+    str: DynoEnum.String,
+    bool: DynoEnum.Boolean,
+    int: DynoEnum.Number,
+    float: DynoEnum.Number,
+    bytes: DynoEnum.Bytes,
+    dict: DynoEnum.Map,
+}
+
+_LIST_DATATYPES = {
+    str: DynoEnum.StringList,
+    bool: DynoEnum.NumberList,
+    int: DynoEnum.NumberList,
+    float: DynoEnum.NumberList,
+    bytes: DynoEnum.ByteList,
+    dict: DynoEnum.List,
+}
+
+# plain str codes, cheaper to compare and emit than going through the enum members
+_S = DynoEnum.String.value
+_N = DynoEnum.Number.value
+_B = DynoEnum.Bytes.value
+_NULL = DynoEnum.Null.value
+_BOOL = DynoEnum.Boolean.value
+_SS = DynoEnum.StringList.value
+_NS = DynoEnum.NumberList.value
+_BS = DynoEnum.ByteList.value
+_M = DynoEnum.Map.value
+_L = DynoEnum.List.value
+
+
 class DynoAttribAutoIncrement:
     __slots__ = ['step', 'start']
 
@@ -58,15 +104,19 @@ class DynoAttribAutoIncrement:
 
 
 class DynoAttrBase:
+    __slots__ = ["always", "readonly", "replace", "_writers", "_readers"]
     code: str = ...
 
     def __init__(self, always: None | bool = None, readonly: None | bool = None):
         self.always = always if isinstance(always, bool) else True
         self.readonly = readonly if isinstance(readonly, bool) else False
         self.replace = False
+        # the code is fixed per class, resolve the handlers by value type once
+        self._writers = _WRITE_VALUE.get(self.code, {})
+        self._readers = _READ.get(self.code, {})
 
     def __repr__(self) -> str:
-        msg = list[str]()
+        msg: list[str] = []
         if self.always:
             msg.append("always")
         if self.readonly:
@@ -78,97 +128,82 @@ class DynoAttrBase:
     def write_value(self, value: any) -> any:
         if value is None:
             return None
-        if isinstance(value, bool) and self.code == DynoEnum.Boolean:
-            return value
-        if isinstance(value, int) and self.code == DynoEnum.Number:
-            return value
-        if isinstance(value, float) and self.code == DynoEnum.Number:
-            return value
-        if isinstance(value, bytes) and self.code == DynoEnum.Bytes:
-            return value
-        if isinstance(value, str) and self.code == DynoEnum.String:
-            return value
-        if isinstance(value, list) and self.code == DynoEnum.StringList:
-            result = list[str]()
-            for item in value:
-                if isinstance(item, str):
-                    result.append(item)
-            return value
-        if isinstance(value, list) and self.code == DynoEnum.NumberList:
-            result = list[int | float]()
-            for item in value:
-                if isinstance(item, (int, float)) and item:
-                    result.append(item)
-            return value
-        myname = self.__class__.__name__
-        raise ValueError(f"{myname}.read: Unsupported value-type {type(value)}")
+        handler = self._writers.get(type(value))
+        if handler is None:
+            myname = self.__class__.__name__
+            raise ValueError(f"{myname}.read: Unsupported value-type {type(value)}")
+        return handler(value)
 
     def write_encode(self, value: any) -> dict[str, any]:
         if value is None:
-            return {self.code: True}
-        if isinstance(value, bool) and self.code == DynoEnum.Boolean:
-            return {self.code: value}
-        if isinstance(value, int) and self.code == DynoEnum.Number:
-            return {self.code: value}
-        if isinstance(value, float) and self.code == DynoEnum.Number:
-            return {self.code: value}
-        if isinstance(value, bytes) and self.code == DynoEnum.Bytes:
-            return {self.code: value}
-        if isinstance(value, str) and self.code == DynoEnum.String:
-            return {self.code: value}
-        if isinstance(value, list) and self.code == DynoEnum.StringList:
-            result = list[str]()
-            for item in value:
-                if isinstance(item, str):
-                    result.append(item)
-            return {self.code: value}
-        if isinstance(value, list) and self.code == DynoEnum.NumberList:
-            result = list[int | float]()
-            for item in value:
-                if isinstance(item, (int, float)) and item:
-                    result.append(item)
-            return {self.code: result}
-        myname = self.__class__.__name__
-        raise ValueError(f"{myname}.read: Unsupported value-type {type(value)}")
+            return {_NULL: True}
+        handler = self._writers.get(type(value))
+        if handler is None:
+            myname = self.__class__.__name__
+            raise ValueError(f"{myname}.read: Unsupported value-type {type(value)}")
+        return {self.code: handler(value)}
 
     def read(self, datatype: str, value: any) -> any:
-        if datatype == DynoEnum.Null:
+        if datatype == _NULL:
             return None
 
         if datatype != self.code:
             myname = self.__class__.__name__
             raise ValueError(f"{myname}.write: expecting type {self.code}")
 
-        if isinstance(value, str) and self.code == DynoEnum.String:
-            return value
-        if isinstance(value, bool) and self.code == DynoEnum.Boolean:
-            return bool(value)
-        if isinstance(value, (float, str)) and self.code == DynoEnum.Number:
-            return float(value)
-        if isinstance(value, (int, str)) and self.code == DynoEnum.Number:
-            return int(value)
-        if isinstance(value, bytes) and self.code == DynoEnum.Bytes:
-            return value
-        if isinstance(value, list) and self.code == DynoEnum.StringList:
-            results = list[str]()
-            for item in value:
-                if isinstance(item, str):
-                    results.append(item)
-            return results
-        if isinstance(value, list) and self.code == DynoEnum.NumberList:
-            results = list[int | float]()
-            for item in value:
-                if isinstance(item, str):
-                    results.append(float(item))
-                if isinstance(item, (int, float)):
-                    results.append(item)
-            return results
+        handler = self._readers.get(type(value))
+        if handler is None:
+            raise ValueError(f"DynoAttrBase:Unsupported value-type {type(value)} when expecting {self.code} dyno-type")
+        return handler(value)
+
+
+def _keep(value: any) -> any:
+    return value
+
+
+def _string_items(value: list) -> list[str]:
+    return [item for item in value if isinstance(item, str)]
+
 
-        raise ValueError(f"DynoAttrBase:Unsupported value-type {type(value)} when expecting {self.code} dyno-type")
+def _number_items(value: list) -> list[int | float]:
+    return [item for item in value if type(item) in (int, float)]
+
+
+def _read_number(value: str) -> int | float:
+    # wire numbers are strings, only the ones with a fraction or exponent are floats
+    if "." in value or "e" in value or "E" in value:
+        return float(value)
+    return int(value)
+
+
+def _read_numbers(value: list) -> list[int | float]:
+    return [_read_number(item) if isinstance(item, str) else item
+            for item in value if isinstance(item, (str, int, float))]
+
+
+# DynoAttrBase handlers by dyno-code then exact value type, bool must not pass as a number
+_WRITE_VALUE = {
+    _BOOL: {bool: _keep},
+    _N: {int: _keep, float: _keep},
+    _B: {bytes: _keep},
+    _S: {str: _keep},
+    _SS: {list: _string_items},
+    _NS: {list: _number_items},
+}
+
+_READ = {
+    _S: {str: _keep},
+    _BOOL: {bool: _keep},
+    _N: {float: _keep, str: _read_number, int: _keep},
+    _B: {bytes: _keep},
+    _SS: {list: _string_items},
+    _NS: {list: _read_numbers},
+}
 
 
 class DynoAttrUuid(DynoAttrBase):
-    code: str = DynoEnum.String.value
+    __slots__ = []
+    code: str = _S
 
     def __init__(self, always: None | bool = None, readonly: None | bool = None):
         super().__init__(always, readonly)
@@ -176,17 +211,35 @@ class DynoAttrUuid(DynoAttrBase):
     def write_value(self, value: any) -> any:
         if isinstance(value, str):
             return value
-        return str(uuid.uuid4()).replace("-", "")
+        if isinstance(value, uuid.UUID):
+            return value.hex
+        return uuid.uuid4().hex
 
     def write_encode(self, value: any) -> dict[str, any]:
         if isinstance(value, str):
             return {self.code: value}
-        return {self.code: str(uuid.uuid4()).replace("-", "")}
+        if isinstance(value, uuid.UUID):
+            return {self.code: value.hex}
+        return {self.code: uuid.uuid4().hex}
+
+
+_now_cache = (0, "0")
+
+
+def _now_text() -> str:
+    # rows stamped within the same second share one string, the tuple swap is atomic
+    global _now_cache
+    now = int(time.time())
+    cached = _now_cache
+    if cached[0] != now:
+        cached = (now, str(now))
+        _now_cache = cached
+    return cached[1]
 
 
 class DynoAttrDateTime(DynoAttrBase):
     __slots__ = ["asinteger", "current"]
-    code: str = DynoEnum.Number.value
+    code: str = _N
 
     def __init__(self, asinteger: None | bool = None, current: None | bool = None,
                  always: None | bool = None, readonly: None | bool = None):
@@ -197,54 +250,52 @@ class DynoAttrDateTime(DynoAttrBase):
 
     def write_value(self, value: any) -> any:
         if self.current:
-            return int(datetime.datetime.utcnow().timestamp())
+            return int(time.time())
         if isinstance(value, datetime.datetime):
             return int(value.timestamp())
         if isinstance(value, (int, float)):
             return int(value)
-        return int(datetime.datetime.utcnow().timestamp())
+        return int(time.time())
 
     def write_encode(self, value: any) -> dict[str, any]:
         if self.current:
-            return {self.code: str(int(datetime.datetime.utcnow().timestamp()))}
+            return {self.code: _now_text()}
         if isinstance(value, datetime.datetime):
             return {self.code: str(int(value.timestamp()))}
         if isinstance(value, (int, float)):
             return {self.code: str(int(value))}
-        return {self.code: str(int(datetime.datetime.utcnow().timestamp()))}
+        return {self.code: _now_text()}
 
     def read(self, datatype: str, value: any) -> any:
-        if datatype == DynoEnum.Null:
+        if datatype == _NULL:
             return None
         if datatype != self.code:
             raise ValueError(f"DynoAttrDateTime.read: Unexpected datatype {datatype}")
         if self.asinteger:
             return int(value)
-        dt = datetime.datetime.utcfromtimestamp(int(value))
-        return dt
+        return datetime.datetime.fromtimestamp(int(value), datetime.timezone.utc)
 
 
 class DynoAttrIntEnum(DynoAttrBase):
-    __slots__ = ["enumclass", "defval"]
-    code: str = DynoEnum.Number.value
+    __slots__ = ["enumclass", "defval", "_by_value"]
+    code: str = _N
 
     def __init__(self, enumclass: type[Enum], defval: None | Enum = None,
                  always: None | bool = None, readonly: None | bool = None):
         super().__init__(always, readonly)
         self.enumclass = enumclass
         self.defval = defval if isinstance(defval, enumclass) else None
+        self._by_value = {item.value: item for item in enumclass if isinstance(item.value, int)}
 
     def read(self, datatype: str, value: any) -> any:
-        if datatype == DynoEnum.Null:
+        if datatype == _NULL:
             if self.defval is not None:
                 return {self.code: str(self.defval.value)}
             return None
 
-        for item in self.enumclass:
-            if isinstance(item.value, int) and datatype == DynoEnum.Number:
-                if item.value == int(value):
-                    return item
-        return None
+        if datatype != _N:
+            return None
+        return self._by_value.get(int(value))
 
     def write_value(self, value: any) -> any:
         if value is None:
@@ -255,9 +306,9 @@ class DynoAttrIntEnum(DynoAttrBase):
         if not isinstance(value, self.enumclass):
             raise ValueError(f"DynoAttrIntEnum.write: Invalid value type {type(value)}")
 
-        for item in self.enumclass:
-            if isinstance(item.value, int) and item.value == value:
-                return int(item.value)
+        item = self._by_value.get(value)
+        if item is not None:
+            return int(item.value)
 
         raise ValueError(f"DynoAttrIntEnum.write: Value {value} is not a valid value")
 
@@ -265,37 +316,36 @@ class DynoAttrIntEnum(DynoAttrBase):
         if value is None:
             if self.defval is not None:
                 return {self.code: str(self.defval.value)}
-            return {DynoEnum.Null.value: True}
+            return {_NULL: True}
 
         if not isinstance(value, self.enumclass):
             raise ValueError(f"DynoAttrIntEnum.write: Invalid value type {type(value)}")
 
-        for item in self.enumclass:
-            if isinstance(item.value, int) and item.value == value:
-                return {self.code: int(item.value)}
+        item = self._by_value.get(value)
+        if item is not None:
+            return {self.code: int(item.value)}
 
         raise ValueError(f"DynoAttrIntEnum.write: Value {value} is not a valid value")
 
 
 class DynoAttrStrEnum(DynoAttrBase):
-    __slots__ = ["enumclass", "defval"]
-    code: str = DynoEnum.String.value
+    __slots__ = ["enumclass", "defval", "_by_value"]
+    code: str = _S
 
     def __init__(self, enumclass: type[Enum], defval: None | Enum = None,
                  always: None | bool = None, readonly: None | bool = None):
         super().__init__(always, readonly)
         self.enumclass = enumclass
         self.defval = defval if isinstance(defval, enumclass) else None
+        self._by_value = {item.value: item for item in enumclass if isinstance(item.value, str)}
 
     def read(self, datatype: str, value: any) -> any:
-        if datatype == DynoEnum.Null:
+        if datatype == _NULL:
             return None
 
-        for item in self.enumclass:
-            if isinstance(item.value, str) and datatype == DynoEnum.String:
-                if item.value == str(value):
-                    return item
-        return None
+        if datatype != _S:
+            return None
+        return self._by_value.get(str(value))
 
     def write_value(self, value: any) -> any:
         if value is None:
@@ -306,9 +356,9 @@ class DynoAttrStrEnum(DynoAttrBase):
         if not isinstance(value, self.enumclass):
             raise ValueError(f"DynoAttrStrEnum.write: Invalid value type {type(value)}")
 
-        for item in self.enumclass:
-            if isinstance(item.value, str) and item.value == value:
-                return str(item.value)
+        item = self._by_value.get(value)
+        if item is not None:
+            return str(item.value)
 
         raise ValueError(f"DynoAttrStrEnum.write: Value {value} is not a valid value")
 
@@ -316,30 +366,30 @@ class DynoAttrStrEnum(DynoAttrBase):
         if value is None:
             if self.defval is not None:
                 return {self.code: str(self.defval.value)}
-            return {DynoEnum.Null.value: True}
+            return {_NULL: True}
 
         if not isinstance(value, self.enumclass):
             raise ValueError(f"DynoAttrStrEnum.write: Invalid value type {type(value)}")
 
-        for item in self.enumclass:
-            if isinstance(item.value, str) and item.value == value:
-                return {self.code: str(item.value)}
+        item = self._by_value.get(value)
+        if item is not None:
+            return {self.code: str(item.value)}
 
         raise ValueError(f"DynoAttrStrEnum.write: Value {value} is not a valid value")
 
 
 class DynoAttrFlag(DynoAttrBase):
     __slots__ = ["options"]
-    code: str = DynoEnum.String.value
+    code: str = _S
 
     def __init__(self, options: set[str], always: None | bool = None, readonly: None | bool = None):
         super().__init__(always, readonly)
-        self.options = options
+        self.options = frozenset(sys.intern(x) if isinstance(x, str) else x for x in options)
 
     def read(self, datatype: str, value: any) -> any:
-        if datatype == DynoEnum.Null:
+        if datatype == _NULL:
             return None
-        if datatype != DynoEnum.String:
+        if datatype != _S:
             raise ValueError(f"DynoAttrFlag.read: Unexpected dyno type {datatype}")
         if not isinstance(value, str):
             raise ValueError(f"DynoAttrFlag.read: Unexpected value type {type(value)}")
@@ -356,18 +406,15 @@ class DynoAttrFlag(DynoAttrBase):
         return value
 
     def write_encode(self, value: any) -> dict[str, any]:
+        value = self.write_value(value)
         if value is None:
-            return {DynoEnum.Null.value: True}
-        if not isinstance(value, str):
-            raise ValueError(f"DynoAttrFlag.write: Invalid value type {type(value)}")
-        if value not in self.options:
-            raise ValueError(f"DynoAttrFlag.write: Value {value} is not a valid flag value")
+            return {_NULL: True}
         return {self.code: value}
 
 
 class DynoAttrString(DynoAttrBase):
-    __slots__ = ["fmt_init", "fmt_save", "min_length", "max_length"]
-    code: str = DynoEnum.String.value
+    __slots__ = ["fmt_init", "fmt_save", "min_length", "max_length", "_unbounded"]
+    code: str = _S
 
     def __init__(self,
                  always: None | bool = None, readonly: None | bool = None,
@@ -381,192 +428,173 @@ class DynoAttrString(DynoAttrBase):
             self.max_length = max(max_length, min_length)
         else:
             self.max_length = max_length if isinstance(max_length, int) else None
+        # no length limits is the common case, skip the clamp entirely
+        self._unbounded = self.min_length is None and self.max_length is None
 
-    def write_value(self, value: any) -> any:
-        if value is None:
-            return None
-
-        if not isinstance(value, str):
-            raise ValueError(f"DynoAttrString.write: Unsupported type {type(value)} for string entry")
-
+    def _clamp(self, value: str) -> str:
         if self.min_length is not None and len(value) < self.min_length:
             raise ValueError(f"DynoAttrString.write: Length must be greater than {self.min_length}")
 
-        if self.max_length is not None and len(value) > self.max_length:
+        if self.max_length is not None:
+            # slicing a str that already fits hands back the same object, no length test needed
             return value[:self.max_length]
 
         return value
 
-    def write_encode(self, value: any) -> dict[str, any]:
+    def write_value(self, value: any) -> any:
         if value is None:
-            return {DynoEnum.Null.value: True}
+            return None
 
         if not isinstance(value, str):
             raise ValueError(f"DynoAttrString.write: Unsupported type {type(value)} for string entry")
 
-        if self.min_length is not None and len(value) < self.min_length:
-            raise ValueError(f"DynoAttrString.write: Length must be greater than {self.min_length}")
+        if self._unbounded:
+            return value
+        return self._clamp(value)
 
-        if self.max_length is not None and len(value) > self.max_length:
-            return {self.code: value[:self.max_length]}
+    def write_encode(self, value: any) -> dict[str, any]:
+        if value is None:
+            return {_NULL: True}
 
-        return {self.code: value}
+        if not isinstance(value, str):
+            raise ValueError(f"DynoAttrString.write: Unsupported type {type(value)} for string entry")
+
+        if self._unbounded:
+            return {self.code: value}
+        return {self.code: self._clamp(value)}
 
 
 class DynoAttrStringList(DynoAttrBase):
-    code: str = DynoEnum.StringList.value
+    __slots__ = []
+    code: str = _SS
 
     def read(self, datatype: str, value: any) -> any:
-        if datatype == DynoEnum.Null:
-            return list[str]()
+        if datatype == _NULL:
+            return []
 
         if datatype != self.code:
             raise ValueError(f"DynoAttrStringList.read: Unexpected dyno-type {datatype}")
 
-        results = list[str]()
         if isinstance(value, list):
-            for item in value:
-                results.append(str(item))
-        return results
+            return list(map(str, value))
+        return []
 
     def write_value(self, value: any) -> any:
         if value is None:
             return None
         if not isinstance(value, list):
             raise ValueError(f"DynoAttrStringList.write: Unexpected value type {type(value)}")
-        results = list[str]()
-        for item in value:
-            results.append(str(item))
+        results = list(map(str, value))
         return results
 
     def write_encode(self, value: any) -> dict[str, any]:
         if value is None:
-            return {DynoEnum.Null.value: True}
+            return {_NULL: True}
         if not isinstance(value, list):
             raise ValueError(f"DynoAttrStringList.write: Unexpected value type {type(value)}")
-        results = list[str]()
-        for item in value:
-            results.append(str(item))
+        results = list(map(str, value))
         return {self.code: results}
 
 
 class DynoAttrIntList(DynoAttrBase):
-    code: str = DynoEnum.NumberList.value
+    __slots__ = []
+    code: str = _NS
 
     def read(self, datatype: str, value: any) -> any:
-        if datatype == DynoEnum.Null:
-            return list[int]()
+        if datatype == _NULL:
+            return []
 
         if datatype != self.code:
             raise ValueError(f"DynoAttrIntList.read: Unexpected dyno-type {datatype}")
 
-        results = list[int]()
         if isinstance(value, list):
-            for item in value:
-                results.append(int(item))
-        return results
+            return list(map(int, value))
+        return []
 
     def write_value(self, value: any) -> any:
         if value is None:
             return None
         if not isinstance(value, list):
             raise ValueError(f"DynoAttrIntList.write: Unexpected value type {type(value)}")
-        results = list[int]()
-        for item in value:
-            results.append(int(item))
+        results = list(map(int, value))
         return results
 
     def write_encode(self, value: any) -> dict[str, any]:
         if value is None:
-            return {DynoEnum.Null.value: True}
+            return {_NULL: True}
         if not isinstance(value, list):
             raise ValueError(f"DynoAttrIntList.write: Unexpected value type {type(value)}")
-        results = list[int]()
-        for item in value:
-            results.append(int(item))
+        results = list(map(int, value))
         return {self.code: results}
 
 
 class DynoAttrFloatList(DynoAttrBase):
-    code: str = DynoEnum.NumberList.value
+    __slots__ = []
+    code: str = _NS
 
     def read(self, datatype: str, value: any) -> any:
-        if datatype == DynoEnum.Null:
-            return list[float]()
+        if datatype == _NULL:
+            return []
 
         if datatype != self.code:
             raise ValueError(f"DynoAttrFloatList.read: Unexpected dyno-type {datatype}")
 
-        results = list[float]()
         if isinstance(value, list):
-            for item in value:
-                results.append(float(item))
-        return results
+            return list(map(float, value))
+        return []
 
     def write_value(self, value: any) -> any:
         if value is None:
             return None
         if not isinstance(value, list):
             raise ValueError(f"DynoAttrFloatList.write: Unexpected value type {type(value)}")
-        results = list[float]()
-        for item in value:
-            results.append(float(item))
+        results = list(map(float, value))
         return results
 
     def write_encode(self, value: any) -> dict[str, any]:
         if value is None:
-            return {DynoEnum.Null.value: True}
+            return {_NULL: True}
         if not isinstance(value, list):
             raise ValueError(f"DynoAttrFloatList.write: Unexpected value type {type(value)}")
-        results = list[float]()
-        for item in value:
-            results.append(float(item))
+        results = list(map(float, value))
         return {self.code: results}
 
 
 class DynoAttrByteList(DynoAttrBase):
-    code: str = DynoEnum.ByteList.value
+    __slots__ = []
+    code: str = _BS
 
     def read(self, datatype: str, value: any) -> any:
-        if datatype == DynoEnum.Null:
-            return list[float]()
+        if datatype == _NULL:
+            return []
 
         if datatype != self.code:
             raise ValueError(f"DynoAttrByteList.read: Unexpected dyno-type {datatype}")
 
-        results = list[bytes]()
         if isinstance(value, list):
-            for item in value:
-                if isinstance(item, bytes):
-                    results.append(item)
-        return results
+            return [item for item in value if isinstance(item, bytes)]
+        return []
 
     def write_value(self, value: any) -> any:
         if value is None:
             return None
         if not isinstance(value, list):
             raise ValueError(f"DynoAttrByteList.write: Unexpected value type {type(value)}")
-        results = list[bytes]()
-        for item in value:
-            if isinstance(item, bytes):
-                results.append(item)
+        results = [item for item in value if isinstance(item, bytes)]
         return results
 
     def write_encode(self, value: any) -> dict[str, any]:
         if value is None:
-            return {DynoEnum.Null.value: True}
+            return {_NULL: True}
         if not isinstance(value, list):
             raise ValueError(f"DynoAttrByteList.write: Unexpected value type {type(value)}")
-        results = list[bytes]()
-        for item in value:
-            if isinstance(item, bytes):
-                results.append(item)
+        results = [item for item in value if isinstance(item, bytes)]
         return {self.code: results}
 
 
 class DynoAttrInt(DynoAttrBase):
-    __slots__ = ["defval", "gt", "ge", "lt", "le"]
-    code: str = DynoEnum.Number.value
+    __slots__ = ["defval", "gt", "ge", "lt", "le", "_bounded"]
+    code: str = _N
 
     def __init__(self, defval: None | int = None,
                  always: None | bool = None, readonly: None | bool = None,
@@ -578,11 +606,23 @@ class DynoAttrInt(DynoAttrBase):
         self.ge = ge
         self.lt = lt
         self.le = le
+        # most numbers carry no range, skip the bound checks entirely for those
+        self._bounded = gt is not None or ge is not None or lt is not None or le is not None
+
+    def _check_bounds(self, value: int) -> None:
+        if self.gt is not None and value <= self.gt:
+            raise ValueError(f"DynoAttrInt.write: Value {value} must be greater than {self.gt}")
+        if self.ge is not None and value < self.ge:
+            raise ValueError(f"DynoAttrInt.write: Value {value} must be greater than or equal to {self.ge}")
+        if self.lt is not None and value >= self.lt:
+            raise ValueError(f"DynoAttrInt.write: Value {value} must be less than {self.lt}")
+        if self.le is not None and value > self.le:
+            raise ValueError(f"DynoAttrInt.write: Value {value} must be less than or equal to {self.le}")
 
     def read(self, datatype: str, value: any) -> any:
-        if datatype == DynoEnum.Null:
+        if datatype == _NULL:
             return None
-        if datatype != DynoEnum.Number:
+        if datatype != _N:
             return None  # just accept it silently
         return int(value)
 
@@ -592,46 +632,38 @@ class DynoAttrInt(DynoAttrBase):
                 return int(self.defval)
             return None
 
-        if not isinstance(value, (int, float)):
-            raise ValueError(f"DynoAttrInt.write: Unexpected value type {type(value)}")
-        value = int(value)
+        vtype = type(value)
+        if vtype is not int:
+            if vtype is not float and not isinstance(value, (int, float)):
+                raise ValueError(f"DynoAttrInt.write: Unexpected value type {type(value)}")
+            value = int(value)
 
-        if self.gt is not None and value <= self.gt:
-            raise ValueError(f"DynoAttrInt.write: Value {value} must be greater than {self.gt}")
-        if self.ge is not None and value < self.ge:
-            raise ValueError(f"DynoAttrInt.write: Value {value} must be greater than or equal to {self.ge}")
-        if self.lt is not None and value >= self.lt:
-            raise ValueError(f"DynoAttrInt.write: Value {value} must be less than {self.lt}")
-        if self.le is not None and value > self.le:
-            raise ValueError(f"DynoAttrInt.write: Value {value} must be less than or equal to {self.le}")
+        if self._bounded:
+            self._check_bounds(value)
 
-        return int(value)
+        return value
 
     def write_encode(self, value: any) -> dict[str, any]:
         if value is None:
             if self.defval is not None:
                 return {self.code: str(self.defval)}
-            return {DynoEnum.Null.value: True}
+            return {_NULL: True}
 
-        if not isinstance(value, (int, float)):
-            raise ValueError(f"DynoAttrInt.write: Unexpected value type {type(value)}")
-        value = int(value)
+        vtype = type(value)
+        if vtype is not int:
+            if vtype is not float and not isinstance(value, (int, float)):
+                raise ValueError(f"DynoAttrInt.write: Unexpected value type {type(value)}")
+            value = int(value)
 
-        if self.gt is not None and value <= self.gt:
-            raise ValueError(f"DynoAttrInt.write: Value {value} must be greater than {self.gt}")
-        if self.ge is not None and value < self.ge:
-            raise ValueError(f"DynoAttrInt.write: Value {value} must be greater than or equal to {self.ge}")
-        if self.lt is not None and value >= self.lt:
-            raise ValueError(f"DynoAttrInt.write: Value {value} must be less than {self.lt}")
-        if self.le is not None and value > self.le:
-            raise ValueError(f"DynoAttrInt.write: Value {value} must be less than or equal to {self.le}")
+        if self._bounded:
+            self._check_bounds(value)
 
         return {self.code: str(value)}
 
 
 class DynoAttrFloat(DynoAttrBase):
-    __slots__ = ["defval", "gt", "ge", "lt", "le"]
-    code: str = DynoEnum.Number.value
+    __slots__ = ["defval", "gt", "ge", "lt", "le", "_bounded"]
+    code: str = _N
 
     def __init__(self, defval: None | float = None,
                  always: None | bool = None, readonly: None | bool = None,
@@ -643,11 +675,23 @@ class DynoAttrFloat(DynoAttrBase):
         self.ge = ge
         self.lt = lt
         self.le = le
+        # most numbers carry no range, skip the bound checks entirely for those
+        self._bounded = gt is not None or ge is not None or lt is not None or le is not None
+
+    def _check_bounds(self, value: float) -> None:
+        if self.gt is not None and value <= self.gt:
+            raise ValueError(f"DynoAttrFloat.write: Value {value} must be greater than {self.gt}")
+        if self.ge is not None and value < self.ge:
+            raise ValueError(f"DynoAttrFloat.write: Value {value} must be greater than or equal to {self.ge}")
+        if self.lt is not None and value >= self.lt:
+            raise ValueError(f"DynoAttrFloat.write: Value {value} must be less than {self.lt}")
+        if self.le is not None and value > self.le:
+            raise ValueError(f"DynoAttrFloat.write: Value {value} must be less than or equal to {self.le}")
 
     def read(self, datatype: str, value: any) -> any:
-        if datatype == DynoEnum.Null:
+        if datatype == _NULL:
             return None
-        if datatype != DynoEnum.Number:
+        if datatype != _N:
             return None  # just accept it silently
         return float(value)
 
@@ -657,46 +701,38 @@ class DynoAttrFloat(DynoAttrBase):
                 return float(self.defval)
             return None
 
-        if not isinstance(value, (int, float)):
-            raise ValueError(f"DynoAttrFloat.write: Unexpected value type {type(value)}")
-        value = float(value)
+        vtype = type(value)
+        if vtype is not float:
+            if vtype is not int and not isinstance(value, (int, float)):
+                raise ValueError(f"DynoAttrFloat.write: Unexpected value type {type(value)}")
+            value = float(value)
 
-        if self.gt is not None and value <= self.gt:
-            raise ValueError(f"DynoAttrFloat.write: Value {value} must be greater than {self.gt}")
-        if self.ge is not None and value < self.ge:
-            raise ValueError(f"DynoAttrFloat.write: Value {value} must be greater than or equal to {self.ge}")
-        if self.lt is not None and value >= self.lt:
-            raise ValueError(f"DynoAttrFloat.write: Value {value} must be less than {self.lt}")
-        if self.le is not None and value > self.le:
-            raise ValueError(f"DynoAttrFloat.write: Value {value} must be less than or equal to {self.le}")
+        if self._bounded:
+            self._check_bounds(value)
 
-        return float(value)
+        return value
 
     def write_encode(self, value: any) -> dict[str, any]:
         if value is None:
             if self.defval is not None:
                 return {self.code: str(self.defval)}
-            return {DynoEnum.Null.value: True}
+            return {_NULL: True}
 
-        if not isinstance(value, (int, float)):
-            raise ValueError(f"DynoAttrFloat.write: Unexpected value type {type(value)}")
-        value = float(value)
+        vtype = type(value)
+        if vtype is not float:
+            if vtype is not int and not isinstance(value, (int, float)):
+                raise ValueError(f"DynoAttrFloat.write: Unexpected value type {type(value)}")
+            value = float(value)
 
-        if self.gt is not None and value <= self.gt:
-            raise ValueError(f"DynoAttrFloat.write: Value {value} must be greater than {self.gt}")
-        if self.ge is not None and value < self.ge:
-            raise ValueError(f"DynoAttrFloat.write: Value {value} must be greater than or equal to {self.ge}")
-        if self.lt is not None and value >= self.lt:
-            raise ValueError(f"DynoAttrFloat.write: Value {value} must be less than {self.lt}")
-        if self.le is not None and value > self.le:
-            raise ValueError(f"DynoAttrFloat.write: Value {value} must be less than or equal to {self.le}")
+        if self._bounded:
+            self._check_bounds(value)
 
         return {self.code: str(value)}
 
 
 class DynoAttrBool(DynoAttrBase):
     __slots__ = ["defval"]
-    code: str = DynoEnum.Boolean.value
+    code: str = _BOOL
 
     def __init__(self, defval: None | bool = None,
                  always: None | bool = None, readonly: None | bool = None):
@@ -713,7 +749,7 @@ class DynoAttrBool(DynoAttrBase):
 
 class DynoAttrBytes(DynoAttrBase):
     __slots__ = ["defval"]
-    code: str = DynoEnum.Bytes.value
+    code: str = _B
 
     def __init__(self, defval: None | bytes = None,
                  always: None | bool = None, readonly: None | bool = None):
@@ -728,50 +764,127 @@ class DynoAttrBytes(DynoAttrBase):
         return super().write_value(value)
 
 
-class DynoAttrMap(DynoAttrBase):
-    code: str = DynoEnum.Map.value
+# member errors logged by nested attributes while a row is tried in one comprehension,
+# held back so a row that is redone member by member does not log them twice
+_pending_member_logs: ContextVar[None | list] = ContextVar("_pending_member_logs", default=None)
+
 
-    def get_attributes(self) -> dict[str, DynoAttrBase]:
-        results = dict[str, DynoAttrBase]()
+def _replay_member_logs(pending: list) -> None:
+    for where, errors in pending:
+        _log_member_errors(where, errors)
 
-        myclass = self.__class__
-        for name, cls_attr in myclass.__dict__.items():
-            if isinstance(cls_attr, DynoAttrBase):
-                results[name] = cls_attr
+
+def _read_members(item: dict, members: MappingProxyType[str, DynoAttrBase], errors: list) -> dict[str, any]:
+    # shared by map and list reads, decodes one encoded element against the declared members
+    # a clean element is decoded in one comprehension, only a failing one is redone member by member
+    pending = []
+    token = _pending_member_logs.set(pending)
+    try:
+        results = {k2: members[k2].read(*next(iter(v2.items())))
+                   for k2, v2 in item.items() if k2 in members and isinstance(v2, dict) and len(v2) == 1}
+    except Exception:
+        results = None
+    finally:
+        _pending_member_logs.reset(token)
+    if results is not None:
+        _replay_member_logs(pending)
         return results
 
+    results: dict[str, any] = {}
+    for k2, v2 in item.items():
+        if not isinstance(v2, dict):
+            continue
+        try:
+            member = members[k2]
+        except KeyError:
+            continue
+        try:
+            (v_type, v_value), = v2.items()
+        except ValueError:
+            continue  # not a single typed value
+        try:
+            results[k2] = member.read(v_type, v_value)
+        except Exception as e:
+            errors.append((k2, e))
+    return results
+
+
+def _write_members(item: dict, members: MappingProxyType[str, DynoAttrBase], errors: list,
+                   encode: bool) -> dict[str, any]:
+    # a clean row is built in one comprehension, only a failing row is redone member by member
+    pending = []
+    token = _pending_member_logs.set(pending)
+    try:
+        if encode:
+            results = {k2: members[k2].write_encode(v2) for k2, v2 in item.items() if k2 in members}
+        else:
+            results = {k2: members[k2].write_value(v2) for k2, v2 in item.items() if k2 in members}
+    except Exception:
+        results = None
+    finally:
+        _pending_member_logs.reset(token)
+    if results is not None:
+        _replay_member_logs(pending)
+        return results
+
+    results: dict[str, any] = {}
+    for k2, v2 in item.items():
+        try:
+            member = members[k2]
+        except KeyError:
+            continue
+        try:
+            results[k2] = member.write_encode(v2) if encode else member.write_value(v2)
+        except Exception as e:
+            errors.append((k2, e))
+    return results
+
+
+def _log_member_errors(where: str, errors: list) -> None:
+    # one summary per call rather than a formatted traceback per broken element
+    pending = _pending_member_logs.get()
+    if pending is not None:
+        pending.append((where, errors))
+        return
+    logger.error(f"{where}: {len(errors)} member errors {errors[:10]!r}")
+
+
+class DynoAttrMap(DynoAttrBase):
+    __slots__ = []
+    code: str = _M
+
+    _attributes: MappingProxyType[str, DynoAttrBase] = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # members are fixed by the class body, collect them once per subclass
+        cls._attributes = MappingProxyType(
+            {name: cls_attr for name, cls_attr in cls.__dict__.items() if isinstance(cls_attr, DynoAttrBase)})
+
+    def get_attributes(self) -> MappingProxyType[str, DynoAttrBase]:
+        return self._attributes
+
     def read(self, datatype: str, value: any) -> any:
-        if datatype == DynoEnum.Null:
+        if datatype == _NULL:
             return list()
         if datatype != self.code:
             raise ValueError(f"DynoAttrMap.read: Unexpected dyno-type {datatype}")
 
-        results = dict[str, dict]()
+        results: dict[str, dict] = {}
         if not isinstance(value, dict):
             return results
 
         members = self.get_attributes()
+        errors = []
         for k1, v1 in value.items():
             if not isinstance(v1, dict):
                 continue
-            v1_ret = dict[str, any]()
-            for k2, v2 in v1.items():
-                if not isinstance(v2, dict):
-                    continue
-                v_type = next(iter(v2))
-                v_value = v2.get(v_type)
-                member = members.get(k2)
-                if member is None:
-                    continue
-
-                try:
-                    v2_ret = member.read(v_type, v_value)
-                    v1_ret[k2] = v2_ret
-                except Exception as e:
-                    logger.exception(f"DynoAttrMap.read: {e!r}")
-
-            results[k1] = v1_ret
+            row_errors = []
+            results[k1] = _read_members(v1, members, row_errors)
+            errors.extend((k1, member, e) for member, e in row_errors)
 
+        if errors:
+            _log_member_errors("DynoAttrMap.read", errors)
         return results
 
     def write_value(self, value: any) -> any:
@@ -781,76 +894,80 @@ class DynoAttrMap(DynoAttrBase):
             raise ValueError(f"DynoAttrMap.write: Unexpected value-type {type(value)}")
 
         members = self.get_attributes()
-        results = dict[str, any]()
+        results: dict[str, any] = {}
+        errors = []
         for k1, v1 in value.items():
-            member = members.get(k1)
-            if member is not None:
-                try:
-                    results[k1] = member.write_value(v1)
-                except Exception as e:
-                    logger.exception(f"DynoAttrMap.write: {e!r}")
+            try:
+                member = members[k1]
+            except KeyError:
+                continue
+            try:
+                results[k1] = member.write_value(v1)
+            except Exception as e:
+                errors.append((k1, e))
+
+        if errors:
+            _log_member_errors("DynoAttrMap.write", errors)
         return results
 
     def write_encode(self, value: any) -> dict[str, any]:
         if value is None:
-            return {DynoEnum.Null.value: True}
+            return {_NULL: True}
         if not isinstance(value, dict):
             raise ValueError(f"DynoAttrMap.write: Unexpected value-type {type(value)}")
 
         members = self.get_attributes()
-        results = dict[str, any]()
+        results: dict[str, any] = {}
+        errors = []
         for k1, v1 in value.items():
-            member = members.get(k1)
-            if member is not None:
-                try:
-                    results[k1] = member.write_encode(v1)
-                except Exception as e:
-                    logger.exception(f"DynoAttrMap.write: {e!r}")
+            try:
+                member = members[k1]
+            except KeyError:
+                continue
+            try:
+                results[k1] = member.write_encode(v1)
+            except Exception as e:
+                errors.append((k1, e))
+
+        if errors:
+            _log_member_errors("DynoAttrMap.write", errors)
         return {self.code: results}
 
 
 class DynoAttrList(DynoAttrBase):
-    code: str = DynoEnum.List.value
+    __slots__ = []
+    code: str = _L
 
-    def get_attributes(self) -> dict[str, DynoAttrBase]:
-        results = dict[str, DynoAttrBase]()
+    _attributes: MappingProxyType[str, DynoAttrBase] = MappingProxyType({})
 
-        myclass = self.__class__
-        for name, cls_attr in myclass.__dict__.items():
-            if isinstance(cls_attr, DynoAttrBase):
-                results[name] = cls_attr
-        return results
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # members are fixed by the class body, collect them once per subclass
+        cls._attributes = MappingProxyType(
+            {name: cls_attr for name, cls_attr in cls.__dict__.items() if isinstance(cls_attr, DynoAttrBase)})
+
+    def get_attributes(self) -> MappingProxyType[str, DynoAttrBase]:
+        return self._attributes
 
     def read(self, datatype: str, value: any) -> any:
-        if datatype == DynoEnum.Null:
+        if datatype == _NULL:
             return list()
         if datatype != self.code:
             raise ValueError(f"DynoAttrList.read: Unexpected dyno-type {datatype}")
 
-        results = list[dict]()
+        results: list[dict] = []
         if not isinstance(value, list):
             return results
 
         members = self.get_attributes()
+        errors = []
         for v1 in value:
             if not isinstance(v1, dict):
                 continue
-            v1_ret = dict[str, any]()
-            for k2, v2 in v1.items():
-                if not isinstance(v2, dict):
-                    continue
-                v_type = next(iter(v2))
-                v_value = v2.get(v_type)
-                member = members.get(k2)
-                if member is None:
-                    continue
-                try:
-                    v2_ret = member.read(v_type, v_value)
-                    v1_ret[k2] = v2_ret
-                except Exception as e:
-                    logger.exception(f"DynoAttrList.read: {e!r}")
-
-            results.append(v1_ret)
+            results.append(_read_members(v1, members, errors))
+
+        if errors:
+            _log_member_errors("DynoAttrList.read", errors)
         return results
 
     def write_value(self, value: any) -> any:
@@ -860,47 +977,35 @@ class DynoAttrList(DynoAttrBase):
             raise ValueError(f"DynoAttrList.write: Unexpected value-type {type(value)}")
 
         members = self.get_attributes()
-        results = list[dict[str, any]]()
+        results: list[dict[str, any]] = []
+        errors = []
         for v1 in value:
             if not isinstance(v1, dict):
                 continue
-            v1_ret = dict[str, any]()
-            for k2, v2 in v1.items():
-                member = members.get(k2)
-                if member is None:
-                    continue
-                try:
-                    v2_ret = member.write_value(v2)
-                    v1_ret[k2] = v2_ret
-                except Exception as e:
-                    logger.exception(f"DynoAttrList.write: {e!r}")
+            v1_ret = _write_members(v1, members, errors, False)
             if len(v1_ret) > 0:
                 results.append(v1_ret)
 
+        if errors:
+            _log_member_errors("DynoAttrList.write", errors)
         return results
 
     def write_encode(self, value: any) -> dict[str, any]:
         if value is None:
-            return {DynoEnum.Null.value: True}
+            return {_NULL: True}
         if not isinstance(value, list):
             raise ValueError(f"DynoAttrList.write: Unexpected value-type {type(value)}")
 
         members = self.get_attributes()
-        results = list[dict[str, any]]()
+        results: list[dict[str, any]] = []
+        errors = []
         for v1 in value:
             if not isinstance(v1, dict):
                 continue
-            v1_ret = dict[str, any]()
-            for k2, v2 in v1.items():
-                member = members.get(k2)
-                if member is None:
-                    continue
-                try:
-                    v2_ret = member.write_encode(v2)
-                    v1_ret[k2] = v2_ret
-                except Exception as e:
-                    logger.exception(f"DynoAttrList.write: {e!r}")
+            v1_ret = _write_members(v1, members, errors, True)
             if len(v1_ret) > 0:
                 results.append(v1_ret)
 
+        if errors:
+            _log_member_errors("DynoAttrList.write", errors)
         return {self.code: results}
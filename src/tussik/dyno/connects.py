@@ -1,9 +1,11 @@
-import copy
 import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
+from botocore.config import Config
 
-from .attributes import DynoAttrDateTime
 from .query import DynoQuery
 from .reading import DynoReader
 from .table import DynoTable, DynoTableLink, DynoSchema
@@ -11,6 +13,29 @@ from .update import DynoUpdate
 
 logger = logging.getLogger()
 
+# keep pooled connections alive so repeated calls skip the tcp/tls handshake
+_CLIENT_CONFIG = Config(tcp_keepalive=True, max_pool_connections=64)
+
+# dynamodb accepts at most 25 put/delete requests per batch_write_item call
+_BATCH_WRITE_SIZE = 25
+_BATCH_WRITE_RETRIES = 5
+
+# counter updates are retried here when throttled, on top of the client's own retries
+_AUTO_INCREMENT_RETRIES = 4
+_THROTTLE_ERRORS = frozenset({"ProvisionedThroughputExceededException", "ThrottlingException",
+                              "RequestLimitExceeded"})
+
+# parallel scans run one thread per segment, keep the fan-out bounded
+_SCAN_SEGMENTS_MAX = 16
+
+# response keys that hold returned items, in the order they are checked
+_RESPONSE_PAYLOADS = ("Items", "Item", "Attributes")
+
+
+def _backoff(attempt: int) -> None:
+    # full jitter, concurrent writers throttled together do not retry in lockstep
+    time.sleep(random.uniform(0, 0.05 * 2 ** attempt))
+
 
 class DynoResponse:
     __slots__ = ["ok", "code", "errors", "data", "consumed", "attributes", "count", "scanned", "LastEvaluatedKey"]
@@ -20,10 +45,10 @@ class DynoResponse:
         self.code = 200
         self.count = 0
         self.scanned = 0
-        self.errors = list[str]()
+        self.errors: list[str] = []
         self.consumed = 0.0
         self.data: any = None
-        self.attributes = dict()
+        self.attributes: dict[str, any] = {}
         self.LastEvaluatedKey: None | dict[str, dict[str, any]] = None
 
     def set_error(self, code: int, message: str) -> None:
@@ -32,30 +57,23 @@ class DynoResponse:
         self.errors.append(message)
 
     def set_response(self, r: dict, link: None | DynoTableLink = None) -> None:
-        self.code = int(r.get('ResponseMetadata', {}).get('HTTPStatusCode', 500))
+        meta = r.get('ResponseMetadata')
+        self.code = int(meta.get('HTTPStatusCode', 500)) if meta else 500
         self.ok = self.code == 200
         self.count = r.get("Count") or 0
         self.scanned = r.get("ScannedCount") or 0
         self.LastEvaluatedKey = r.get("LastEvaluatedKey")
 
-        if "ConsumedCapacity" in r:
-            self.consumed = r.get("ConsumedCapacity", dict()).get("CapacityUnits") or 0.0
-
-        if "Items" in r:
-            reader = DynoReader(r.get("Items"))
-            self.data = reader.decode(link.table, link.schema)
-            return
+        consumed = r.get("ConsumedCapacity")
+        if isinstance(consumed, dict):
+            self.consumed = consumed.get("CapacityUnits") or 0.0
 
-        if "Item" in r:
-            reader = DynoReader(r['Item'])
-            self.data = reader.decode(link.table, link.schema)
-            return
-
-        if "Attributes" in r:
-            reader = DynoReader(r['Attributes'])
-            self.data = reader.decode(link.table, link.schema)
-            return
-        return
+        # a response carries at most one payload, decoded the same way whichever key holds it
+        for name in _RESPONSE_PAYLOADS:
+            payload = r.get(name)
+            if payload is not None:
+                self.data = DynoReader(payload).decode(link.table, link.schema)
+                return
 
     def __repr__(self):
         if self.ok and self.data is None:
@@ -68,11 +86,9 @@ class DynoResponse:
 
 
 class DynoConnect:
-    __slots__ = ["_host", "_access", "_secret", "_region"]
-    __g_host: None | str = None
-    __g_access: None | str = None
-    __g_secret: None | str = None
-    __g_region: None | str = None
+    __slots__ = ["_host", "_access", "_secret", "_region", "_client", "_resource"]
+    # host, access, secret and region used when a connection does not name its own
+    __g_defaults: tuple[None | str, None | str, None | str, None | str] = (None, None, None, None)
 
     def __init__(self,
                  host: None | str = None,
@@ -80,10 +96,13 @@ class DynoConnect:
                  secret: None | str = None,
                  region: None | str = None
                  ):
-        self._host = host or DynoConnect.__g_host
-        self._access = access or DynoConnect.__g_access
-        self._secret = secret or DynoConnect.__g_secret
-        self._region = region or DynoConnect.__g_region
+        g_host, g_access, g_secret, g_region = DynoConnect.__g_defaults
+        self._host = host or g_host
+        self._access = access or g_access
+        self._secret = secret or g_secret
+        self._region = region or g_region
+        self._client = None
+        self._resource = None
 
     def __repr__(self):
         if self._host is not None:
@@ -93,50 +112,35 @@ class DynoConnect:
 
     @classmethod
     def set_host(cls, host: None | str = None) -> None:
-        cls.__g_host = host or "http://localhost:8000"
-        cls.__g_access = None
-        cls.__g_secret = None
-        cls.__g_region = None
+        cls.__g_defaults = (host or "http://localhost:8000", None, None, None)
 
     @classmethod
     def set_iam(cls) -> None:
-        cls.__g_host = None
-        cls.__g_access = None
-        cls.__g_secret = None
-        cls.__g_region = None
+        cls.__g_defaults = (None, None, None, None)
 
     @classmethod
     def set_aws(cls, access: str, secret: str, region: None | str = None) -> None:
-        cls.__g_host = None
-        cls.__g_access = access
-        cls.__g_secret = secret
-        cls.__g_region = region
+        cls.__g_defaults = (None, access, secret, region)
+
+    def _params(self) -> dict[str, str]:
+        return {name: value for name, value in (
+            ("endpoint_url", self._host),
+            ("aws_access_key_id", self._access),
+            ("aws_secret_access_key", self._secret),
+            ("region_name", self._region)) if value is not None}
 
     def client(self) -> 'botocore.client.DynamoDB':
-        params = dict()
-        if self._host is not None:
-            params["endpoint_url"] = self._host
-        if self._access is not None:
-            params["aws_access_key_id"] = self._access
-        if self._secret is not None:
-            params["aws_secret_access_key"] = self._secret
-        if self._region is not None:
-            params["region_name"] = self._region
-        ddb = boto3.client('dynamodb', **params)
-        return ddb
+        # building a client loads the service model and endpoint rules, do it once per connection
+        if self._client is None:
+            self._client = boto3.client('dynamodb', config=_CLIENT_CONFIG, **self._params())
+        return self._client
 
     def resource(self) -> 'dynamodb.ServiceResource':
-        params = dict()
-        if self._host is not None:
-            params["endpoint_url"] = self._host
-        if self._access is not None:
-            params["aws_access_key_id"] = self._access
-        if self._secret is not None:
-            params["aws_secret_access_key"] = self._secret
-        if self._region is not None:
-            params["region_name"] = self._region
-        ddb = boto3.resource('dynamodb', **params)
-        return ddb
+        if self._resource is not None:
+            return self._resource
+
+        self._resource = boto3.resource('dynamodb', config=_CLIENT_CONFIG, **self._params())
+        return self._resource
 
     def put_item(self, data: dict[str, any],
                  table: type[DynoTable],
@@ -149,7 +153,8 @@ class DynoConnect:
                 dr.set_error(500, f"DynoConnect.put_item: invalid data parameter")
                 return dr
 
-            dataset = copy.deepcopy(data)
+            # only top-level gsi keys are removed, a shallow copy keeps the caller data intact
+            dataset = dict(data)
             ignore_gsi = ignore_gsi if isinstance(ignore_gsi, bool) else False
             if ignore_gsi:
                 for name, gsi in table.get_globalindexes().items():
@@ -162,18 +167,14 @@ class DynoConnect:
             reader = DynoReader(dr.data)
             item = reader.encode(table, schema)
 
-            cond_list = list[str]()
-            cond_list.append(f"attribute_exists({table.Key.pk})")
-            cond_list.append(f"attribute_exists({table.Key.sk})")
+            cond_list: list[str] = [table.get_key_condition(True)]
 
             # enforce gsi uniqueness when enabled
             enforce_gsi = enforce_gsi if isinstance(enforce_gsi, bool) else True
             if enforce_gsi and not ignore_gsi:
-                for name, gsi in table.get_globalindexes().items():
-                    if gsi.unique and gsi.pk in item:
-                        cond_list.append(f"attribute_not_exists({gsi.pk})")
-                    if gsi.unique and gsi.sk in item:
-                        cond_list.append(f"attribute_not_exists({gsi.sk})")
+                for name, condition in table.get_unique_conditions():
+                    if name in item:
+                        cond_list.append(condition)
 
             condition = " AND ".join(cond_list)
 
@@ -210,16 +211,12 @@ class DynoConnect:
             reader = DynoReader(dr.data)
             item = reader.encode(table, schema)
 
-            cond_list = list[str]()
-            cond_list.append(f"attribute_not_exists({table.Key.pk})")
-            cond_list.append(f"attribute_not_exists({table.Key.sk})")
+            cond_list: list[str] = [table.get_key_condition(False)]
 
             # enforce gsi uniqueness when enabled
-            for name, gsi in table.get_globalindexes().items():
-                if gsi.unique and gsi.pk in item:
-                    cond_list.append(f"attribute_not_exists({gsi.pk})")
-                if gsi.unique and gsi.sk in item:
-                    cond_list.append(f"attribute_not_exists({gsi.sk})")
+            for name, condition in table.get_unique_conditions():
+                if name in item:
+                    cond_list.append(condition)
 
             db = self.client()
             r = db.put_item(
@@ -243,41 +240,88 @@ class DynoConnect:
                 dr.set_error(500, f"{e!r}")
         return dr
 
-    def delete_item(self, data: dict, table: type[DynoTable], schema: type[DynoSchema]) -> DynoResponse:
+    def put_many(self, data: list[dict[str, any]],
+                 table: type[DynoTable], schema: type[DynoSchema]) -> DynoResponse:
+        # batch writes cannot carry a condition, unlike put_item the item is not required to exist
+        # and unique global indexes are not checked, an existing item with the same key is overwritten
         dr = DynoResponse()
-
         try:
-            check = table.get_schema(schema.get_schema_name())
-            if check is None:
-                dr.set_error(400, f"Schema {schema} not found")
+            if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+                dr.set_error(500, f"DynoConnect.put_many: invalid data parameter")
                 return dr
 
-            key = table.Key
-            fmt = schema.Key
-            if fmt is None:
-                dr.set_error(400, f"Key format for {schema} not found")
-                return dr
+            if len(table.get_unique_conditions()) > 0:
+                logger.warning(f"DynoConnect.put_many({table}[{schema}]): unique global indexes are not enforced")
+
+            values: list[dict] = []
+            requests: list[dict] = []
+            for row in data:
+                value = table.write_value(row, schema, include_readonly=True)
+                values.append(value)
+                requests.append({"PutRequest": {"Item": DynoReader(value).encode(table, schema)}})
 
-            #
-            # generate key values
-            #
-            pk = fmt.format_pk(data)
-            sk = fmt.format_sk(data)
-            if pk is None or sk is None:
-                dr.set_error(400, "One or more key values are not available")
+            db = self.client()
+            for start in range(0, len(requests), _BATCH_WRITE_SIZE):
+                pending = {table.TableName: requests[start:start + _BATCH_WRITE_SIZE]}
+                for attempt in range(_BATCH_WRITE_RETRIES):
+                    r = db.batch_write_item(RequestItems=pending, ReturnConsumedCapacity="TOTAL")
+                    for capacity in r.get("ConsumedCapacity") or []:
+                        dr.consumed += capacity.get("CapacityUnits") or 0.0
+                    pending = r.get("UnprocessedItems")
+                    if not pending:
+                        break
+                    if attempt + 1 < _BATCH_WRITE_RETRIES:
+                        _backoff(attempt)  # throttled, back off before resubmitting the rest
+                if pending:
+                    # earlier batches are already written, report exactly the rows that landed
+                    unprocessed = pending.get(table.TableName) or []
+                    dr.data = values[:start] + [
+                        value for value, request in zip(values[start:start + _BATCH_WRITE_SIZE],
+                                                        requests[start:start + _BATCH_WRITE_SIZE])
+                        if request not in unprocessed]
+                    dr.count = len(dr.data)
+                    dr.set_error(503, f"Failed to put {table}[{schema}]: {len(values) - dr.count} rows not written")
+                    return dr
+
+            dr.data = values
+            dr.count = len(values)
+        except Exception as e:
+            logger.exception(f"DynoConnect.put_many({table}[{schema}])")
+            dr.set_error(500, f"{e!r}")
+        return dr
+
+    @staticmethod
+    def _item_key(dr: DynoResponse, data: dict, table: type[DynoTable],
+                  schema: type[DynoSchema]) -> None | dict[str, dict[str, any]]:
+        # shared by the single item calls, records the reason on dr when the key cannot be built
+        check = table.get_schema(schema.get_schema_name())
+        if check is None:
+            dr.set_error(400, f"Schema {schema} not found")
+            return None
+
+        fmt = schema.Key
+        if fmt is None:
+            dr.set_error(400, f"Key format for {schema} not found")
+            return None
+
+        pk = fmt.format_pk(data)
+        sk = fmt.format_sk(data)
+        if pk is None or sk is None:
+            dr.set_error(400, "One or more key values are not available")
+            return None
+        return table.Key.key_item(pk, sk)
+
+    def delete_item(self, data: dict, table: type[DynoTable], schema: type[DynoSchema]) -> DynoResponse:
+        dr = DynoResponse()
+
+        try:
+            item_key = self._item_key(dr, data, table, schema)
+            if item_key is None:
                 return dr
 
             params = {
                 "TableName": table.TableName,
-                "ExpressionAttributeValues": {
-                    ":v1": {key.pk_type.value: pk},
-                    ":v2": {key.sk_type.value: sk}
-                },
-                "ExpressionAttributeNames": {
-                    "#n1": key.pk,
-                    "#n2": key.sk
-                },
-                "KeyConditionExpression": f"#n1 = :v1 AND #n2 = :v2",
+                "Key": item_key,
                 "ReturnValues": "ALL_OLD",
                 "ReturnValuesOnConditionCheckFailure": "ALL_OLD"
             }
@@ -288,8 +332,7 @@ class DynoConnect:
             dr.set_response(r, link)
             if dr.data is None:
                 dr.data = []
-            dr.ok = len(data) > 0
-            if len(dr.data) >= 1:
+            if isinstance(dr.data, list) and len(dr.data) >= 1:
                 dr.data = dr.data[0]  # only report one record or no record always
         except Exception as e:
             if type(e).__name__ == "ConditionalCheckFailedException":
@@ -303,32 +346,13 @@ class DynoConnect:
         dr = DynoResponse()
 
         try:
-            check = table.get_schema(schema.get_schema_name())
-            if check is None:
-                dr.set_error(400, f"Schema {schema} not found")
-                return dr
-
-            key = table.Key
-            fmt = schema.Key
-            if fmt is None:
-                dr.set_error(400, f"Key format for {schema} not found")
-                return dr
-
-            #
-            # generate key values
-            #
-            pk = fmt.format_pk(data)
-            sk = fmt.format_sk(data)
-            if pk is None or sk is None:
-                dr.set_error(400, "One or more key values are not available")
+            item_key = self._item_key(dr, data, table, schema)
+            if item_key is None:
                 return dr
 
             params = {
                 "TableName": table.TableName,
-                "Key": {
-                    key.pk: {key.pk_type.value: pk},
-                    key.sk: {key.sk_type.value: sk}
-                },
+                "Key": item_key,
                 "ConsistentRead": False,
                 "ReturnConsumedCapacity": "INDEXES",
             }
@@ -391,6 +415,57 @@ class DynoConnect:
             dr.set_error(500, f"{e!r}")
         return dr
 
+    def scan_all(self, query: DynoQuery, segments: int = 4) -> DynoResponse:
+        # every matching item is collected in memory, query.limit caps the total across all segments
+        dr = DynoResponse()
+        try:
+            if not isinstance(segments, int) or not 1 <= segments <= _SCAN_SEGMENTS_MAX:
+                dr.set_error(400, f"DynoConnect.scan_all: segments must be between 1 and {_SCAN_SEGMENTS_MAX}")
+                return dr
+
+            params = query.build(for_scan=True)
+            if params is None:
+                dr.set_error(500, "Query incomplete")
+                return dr
+
+            # every segment pages through its own slice of the table, a start key does not apply
+            params.pop("ExclusiveStartKey", None)
+            limit = query.limit
+            db = self.client()
+
+            def scan_segment(segment: int) -> tuple[list, int, float]:
+                items: list[dict] = []
+                scanned, consumed = 0, 0.0
+                request = dict(params, Segment=segment, TotalSegments=segments)
+                while True:
+                    r = db.scan(**request)
+                    items.extend(r.get("Items") or [])
+                    scanned += r.get("ScannedCount") or 0
+                    consumed += (r.get("ConsumedCapacity") or {}).get("CapacityUnits") or 0.0
+                    if "LastEvaluatedKey" not in r or (limit is not None and len(items) >= limit):
+                        return items, scanned, consumed
+                    request["ExclusiveStartKey"] = r["LastEvaluatedKey"]
+
+            # the round trips dominate, the client is thread safe so the segments run side by side
+            with ThreadPoolExecutor(max_workers=segments) as pool:
+                results = list(pool.map(scan_segment, range(segments)))
+
+            items = [item for segment_items, _, _ in results for item in segment_items]
+            if limit is not None:
+                items = items[:limit]
+            r = {
+                "ResponseMetadata": {"HTTPStatusCode": 200},
+                "Items": items,
+                "Count": len(items),
+                "ScannedCount": sum(scanned for _, scanned, _ in results),
+                "ConsumedCapacity": {"CapacityUnits": sum(consumed for _, _, consumed in results)},
+            }
+            dr.set_response(r, query.get_link())
+        except Exception as e:
+            logger.exception(f"DynoConnect.scan_all({query.TableName}) {e!r}")
+            dr.set_error(500, f"{e!r}")
+        return dr
+
     def all(self, table: type[DynoTable], schema: type[DynoSchema] | None = None, globalindex: None | str = None,
             limit: int = 100, startkey: None | dict = None) -> DynoResponse:
         query = DynoQuery(table, schema, globalindex)
@@ -399,7 +474,7 @@ class DynoConnect:
         if schema is None:
             dr = self.scan(query)
         else:
-            query.apply_key(dict())
+            query.apply_key({})
             if query.Key.pk:
                 dr = self.query(query)
             else:
@@ -526,42 +601,47 @@ class DynoConnect:
                 return dr
 
             pk = schema.Key.format_pk(data)
+            # counter rows have always been stored under the pk template in both key positions,
+            # changing that would move existing counters to a new item and restart their sequences
             sk = schema.Key.format_pk(data)
-            item = {
-                table.Key.pk: {table.Key.pk_type.value: pk},
-                table.Key.sk: {table.Key.sk_type.value: sk}
-            }
+            item = table.Key.key_item(pk, sk)
 
             if isinstance(table.SchemaFieldName, str) and len(table.SchemaFieldName) > 0:
                 item[table.SchemaFieldName] = {"S": str(schema.get_schema_name())}
 
-            conditional = f"attribute_not_exists({table.Key.pk}) AND attribute_not_exists({table.Key.sk})"
-            r = db.put_item(
-                TableName=table.TableName,
-                Item=item,
-                ConditionExpression=conditional,
-                ReturnConsumedCapacity="INDEXES",
-                ReturnItemCollectionMetrics="SIZE",
-            )
+            for attempt in range(_AUTO_INCREMENT_RETRIES):
+                try:
+                    r = db.put_item(
+                        TableName=table.TableName,
+                        Item=item,
+                        ConditionExpression=table.get_key_condition(False),
+                        ReturnConsumedCapacity="INDEXES",
+                        ReturnItemCollectionMetrics="SIZE",
+                    )
+                    break
+                except Exception as e:
+                    if type(e).__name__ not in _THROTTLE_ERRORS or attempt + 1 == _AUTO_INCREMENT_RETRIES:
+                        raise
+                    _backoff(attempt)
             link = table.get_link(schema)
             dr.set_response(r, link)
             if dr.code != 200:
                 logger.error(f"DynoConnect._insert_auto_increment({table}[{schema}])")
                 dr.set_error(dr.code, f"Failed to insert {table}[{schema}")
         except Exception as e:
-            logger.exception(f"DynoConnect._insert_auto_increment({table}[{schema}])")
-            dr.set_error(500, f"{e!r}")
+            if type(e).__name__ == "ConditionalCheckFailedException":
+                # another writer created the counter row first, expected when counters race
+                logger.debug("DynoConnect._insert_auto_increment(%s[%s]) already exists", table, schema)
+                dr.set_error(400, f"Already Exists")
+            else:
+                logger.exception(f"DynoConnect._insert_auto_increment({table}[{schema}])")
+                dr.set_error(500, f"{e!r}")
         return dr
 
     def set_time_to_live(self, table: type[DynoTable], expired_time_attribute: str, enable: bool) -> DynoResponse:
         dr = DynoResponse()
 
-        confirmed = False
-        for schema, tbl in table.get_schemas().items():
-            for name, attrib in tbl.get_attributes():
-                if name == expired_time_attribute and isinstance(attrib, DynoAttrDateTime):
-                    confirmed = True
-        if not confirmed:
+        if expired_time_attribute not in table.get_datetime_attributes():
             dr.set_error(404, f"The DateTime Attribute {expired_time_attribute} was not found")
             return dr
 
@@ -587,22 +667,30 @@ class DynoConnect:
             return None
 
         db = self.client()
-        result = None
-
-        for retry in range(2):
+        inserted = False
+        throttled = 0
+        while True:
             try:
                 r = db.update_item(**params)
-                nextid = r.get("Attributes", dict()).get(name, dict()).get("N")
+                nextid = r.get("Attributes", {}).get(name, {}).get("N")
                 if nextid is None:
-                    break
-                result = int(nextid)
-                break
+                    logger.error(f"DynoConnect.auto_increment({table}.{schema}.{name}) returned no value")
+                    return None
+                return int(nextid)
             except Exception as e:
-                if type(e).__name__ == "ConditionalCheckFailedException":
-                    dr = self._insert_auto_increment(data, table, schema)
-                    if not dr.ok:
-                        break
-                else:
-                    logger.exception(f"DynoConnect.auto_increment({table}.{schema}.{name}) {e!r}")
-                    break
-        return result
+                error = type(e).__name__
+                if error == "ConditionalCheckFailedException" and not inserted:
+                    # the counter row is missing, create it once, losing that race to another writer is fine
+                    inserted = True
+                    self._insert_auto_increment(data, table, schema)
+                    continue
+                if error in _THROTTLE_ERRORS:
+                    throttled += 1
+                    if throttled < _AUTO_INCREMENT_RETRIES:
+                        _backoff(throttled - 1)
+                        continue
+                    logger.error(f"DynoConnect.auto_increment({table}.{schema}.{name}) "
+                                 f"still throttled after {throttled} attempts")
+                    return None
+                logger.exception(f"DynoConnect.auto_increment({table}.{schema}.{name}) {e!r}")
+                return None
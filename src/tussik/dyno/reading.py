@@ -1,9 +1,17 @@
 import logging
+from types import MappingProxyType
 
 from tussik.dyno import DynoEnum
 
 logger = logging.getLogger()
 
+_DYNO_TYPES: dict[str, DynoEnum] = {item.value: item for item in DynoEnum}
+_NULL = DynoEnum.Null.value
+_N = DynoEnum.Number.value
+
+# table and schema classes are fixed once declared, so is the allow list derived from them
+_ALLOW_LISTS: dict[tuple[type, None | type], MappingProxyType[str, DynoEnum]] = {}
+
 
 class DynoReader:
     __slots__ = ['_dataset', '_cache']
@@ -14,7 +22,7 @@ class DynoReader:
             self._dataset = self._read_list(data)
         elif isinstance(data, dict):
             self._dataset = self._read_dict(data)
-        self._cache = dict[str, any]()
+        self._cache: dict[str, any] = {}
 
     def __repr__(self):
         return f'DynoReader with {len(self._dataset)} elements'
@@ -31,20 +39,17 @@ class DynoReader:
             self._cache[key] = value
 
     def _read_list(self, data: list) -> list[dict]:
-        dataset = list[dict]()
-        for item in data:
-            value = self._read_dict(item)
-            dataset.append(value)
-        return dataset
+        read_dict = self._read_dict
+        return [read_dict(item) for item in data]
 
     def _read_dict(self, data: dict) -> dict:
-        dataset = dict[str, any]()
+        dataset: dict[str, any] = {}
 
         for name, value in data.items():
             if isinstance(value, dict) and len(value) == 1:
                 key = next(iter(value))
-                dt = DynoEnum(key)
-                if isinstance(dt, DynoEnum):
+                dt = _DYNO_TYPES.get(key)
+                if dt is not None:
                     # THIS IS ENCODED
                     if dt == DynoEnum.Map:
                         dataset[name] = self._read_dict(value[key])
@@ -57,21 +62,24 @@ class DynoReader:
             if isinstance(value, dict):
                 dataset[name] = self._read_dict(value)
             elif isinstance(value, list):
-                dataset[name] = list()
-                for item in value:
-                    dataset[name].append(item)
+                dataset[name] = list(value)
             else:
                 dataset[name] = value
 
         return dataset
 
-    def allow_list(self, table: type["DynoTable"], schema: type["DynoSchema"] | None = None) -> dict[str, DynoEnum]:
+    def allow_list(self, table: type["DynoTable"],
+                   schema: type["DynoSchema"] | None = None) -> MappingProxyType[str, DynoEnum]:
         if issubclass(table, type("DynoTable")):
             raise ValueError("table must be DynoTable Type")
         if schema is not None and issubclass(schema, type("DynoSchema")):
             raise ValueError("schema must be DynoSchema Type")
 
-        result = dict[str, DynoEnum]()
+        cached = _ALLOW_LISTS.get((table, schema))
+        if cached is not None:
+            return cached
+
+        result: dict[str, DynoEnum] = {}
         result[table.Key.pk] = table.Key.pk_type
         result[table.Key.sk] = table.Key.sk_type
         for name, gsi in table.get_globalindexes().items():
@@ -86,8 +94,11 @@ class DynoReader:
                     continue
             attributes = tbl.get_attributes(nested=True)
             for attr_name, base in attributes.items():
-                result[attr_name] = DynoEnum(base.code)
-        return result
+                result[attr_name] = _DYNO_TYPES[base.code]
+
+        # shared by every reader, hand out a read-only view
+        _ALLOW_LISTS[(table, schema)] = MappingProxyType(result)
+        return _ALLOW_LISTS[(table, schema)]
 
     def decode(self, table: type["DynoTable"], schema: type['DynoSchema'] | None = None) -> None | dict | list:
         if issubclass(table, type("DynoTable")):
@@ -117,8 +128,9 @@ class DynoReader:
                 if isinstance(value, dict):
                     value[table.SchemaFieldName] = schema.get_schema_name()
                 elif isinstance(value, list):
+                    field, name = table.SchemaFieldName, schema.get_schema_name()
                     for item in value:
-                        item[table.SchemaFieldName] = schema.get_schema_name()
+                        item[field] = name
 
         except Exception as e:
             logger.exception(f"DynoReader.decode")
@@ -128,20 +140,15 @@ class DynoReader:
         return value
 
     def _decode_list(self, allowlist: dict[str, DynoEnum], data: any, prefix: None | str = None) -> list:
-        dataset = list()
-        for item in data:
-            if isinstance(item, list):
-                value = self._decode_list(allowlist, item, prefix)
-                dataset.append(value)
-            elif isinstance(item, dict):
-                value = self._decode_dict(allowlist, item, prefix)
-                dataset.append(value)
-            else:
-                dataset.append(item)
-        return dataset
+        decode_list = self._decode_list
+        decode_dict = self._decode_dict
+        return [decode_dict(allowlist, item, prefix) if isinstance(item, dict)
+                else decode_list(allowlist, item, prefix) if isinstance(item, list)
+                else item
+                for item in data]
 
     def _decode_dict(self, allowlist: dict[str, DynoEnum], data: any, prefix: None | str = None) -> dict:
-        dataset = dict()
+        dataset: dict[str, any] = {}
 
         try:
             for name, item in data.items():
@@ -158,7 +165,11 @@ class DynoReader:
                     value = self._decode_dict(allowlist, item, new_prefix)
                     dataset[name] = value
                 else:
-                    if dt == DynoEnum.Number:
+                    if dt == DynoEnum.Number and isinstance(item, str) and not (
+                            "." in item or "e" in item or "E" in item):
+                        # integers, signed or not, skip the float round trip and keep their precision
+                        dataset[name] = int(item)
+                    elif dt == DynoEnum.Number:
                         new_value = float(item)
                         if new_value.is_integer():
                             new_value = int(new_value)
@@ -207,7 +218,7 @@ class DynoReader:
         return value
 
     def _encode_list(self, allowlist: dict[str, DynoEnum], data: any, prefix: None | str = None) -> list:
-        dataset = list()
+        dataset: list = []
         for item in data:
             if isinstance(item, list):
                 value = self._encode_list(allowlist, item, prefix)
@@ -220,7 +231,7 @@ class DynoReader:
         return dataset
 
     def _encode_dict(self, allowlist: dict[str, DynoEnum], data: any, prefix: None | str = None) -> dict:
-        dataset = dict()
+        dataset: dict[str, any] = {}
 
         for name, item in data.items():
             new_prefix = f"{prefix}.{name}" if isinstance(prefix, str) else name
@@ -235,8 +246,8 @@ class DynoReader:
                 value = self._encode_dict(allowlist, item, new_prefix)
                 dataset[name] = {dt.value: value}
             elif item is None:
-                dataset[name] = {DynoEnum.Null.value: True}
-            elif dt.value == DynoEnum.Number:
+                dataset[name] = {_NULL: True}
+            elif dt.value == _N:
                 dataset[name] = {dt.value: str(item)}
             else:
                 dataset[name] = {dt.value: item}
@@ -1,7 +1,10 @@
 import inspect
 import logging
+import string
+from types import MappingProxyType
+from typing import Callable
 
-from .attributes import DynoEnum, DynoAttrBase, DynoAttribAutoIncrement, DynoAttrMap, DynoAttrList
+from .attributes import DynoEnum, DynoAttrBase, DynoAttribAutoIncrement, DynoAttrMap, DynoAttrList, DynoAttrDateTime
 
 logger = logging.getLogger()
 
@@ -36,7 +39,7 @@ class DynoTableLink:
 
 
 class DynoKey:
-    __slots__ = ["_pk", "_sk", "_pk_type", "_sk_type"]
+    __slots__ = ["_pk", "_sk", "_pk_type", "_sk_type", "_pk_tag", "_sk_tag"]
 
     def __init__(self,
                  pk: None | str = None, sk: None | str = None,
@@ -46,6 +49,8 @@ class DynoKey:
         self._sk: str = sk or "sk"
         self._pk_type: DynoEnum = pk_type or DynoEnum.String
         self._sk_type: DynoEnum = sk_type or DynoEnum.String
+        self._pk_tag: str = self._pk_type.value
+        self._sk_tag: str = self._sk_type.value
 
     @property
     def pk(self) -> str:
@@ -63,21 +68,105 @@ class DynoKey:
     def sk_type(self) -> DynoEnum:
         return self._sk_type
 
+    def key_item(self, pk: any, sk: any) -> dict[str, dict[str, any]]:
+        # encoded primary key, the names and type tags are fixed per key
+        return {self._pk: {self._pk_tag: pk}, self._sk: {self._sk_tag: sk}}
+
     def __repr__(self):
         return f"DynoKey: {self._pk}, {self._sk}"
 
 
+class DynoKeyTemplate:
+    __slots__ = ["text", "_head", "_fields"]
+
+    def __init__(self, text: None | str = None):
+        self.text: None | str = text
+        self._head: str = ""
+        self._fields: None | tuple[tuple[str, str], ...] = None
+        if isinstance(text, str):
+            self._compile(text)
+
+    def __repr__(self):
+        return f"DynoKeyTemplate: {self.text}"
+
+    def _compile(self, text: str) -> None:
+        # split the template once into literal chunks and field names, anything beyond
+        # plain named fields (format specs, conversions, indexing) is left to str.format
+        try:
+            parsed = list(string.Formatter().parse(text))
+        except ValueError:
+            return
+
+        head = ""
+        fields = list[tuple[str, str]]()
+        for literal, name, spec, conversion in parsed:
+            if len(fields) == 0:
+                head += literal
+            elif literal:
+                last_name, last_literal = fields[-1]
+                fields[-1] = (last_name, last_literal + literal)
+            if name is None:
+                continue
+            if not name.isidentifier() or spec or conversion is not None:
+                return
+            fields.append((name, ""))
+
+        self._head = head
+        self._fields = tuple(fields)
+
+    def render(self, values: dict[str, any]) -> str:
+        if self._fields is None:
+            return self.text.format(**values)
+        parts = [self._head]
+        for name, literal in self._fields:
+            parts.append(format(values[name]))
+            parts.append(literal)
+        return "".join(parts)
+
+    def format(self, values: None | dict[str, any], req: set[str]) -> None | str:
+        if self.text is None:
+            return None
+        try:
+            value = self.render(values or dict())
+            if "None" in value:
+                for check in req:
+                    if check not in values:
+                        return None
+                    if values[check] is None:
+                        return None
+            return value
+        except Exception as e:
+            pass
+        return None
+
+
 class DynoKeyFormat:
-    __slots__ = ["pk", "sk", "req"]
+    __slots__ = ["_pk", "_sk", "req"]
 
     def __init__(self, pk: None | str = None, sk: None | str = None, req: None | set[str] = None):
-        self.pk: str = pk
-        self.sk: str = sk
+        self._pk = DynoKeyTemplate(pk)
+        self._sk = DynoKeyTemplate(sk)
         self.req: set[str] = req or set[str]()
 
     def __repr__(self):
         return f"DynoKeyFormat: pk={self.pk}, sk={self.sk}, req={' '.join(self.req)}"
 
+    @property
+    def pk(self) -> None | str:
+        return self._pk.text
+
+    @pk.setter
+    def pk(self, value: None | str) -> None:
+        self._pk = DynoKeyTemplate(value)
+
+    @property
+    def sk(self) -> None | str:
+        return self._sk.text
+
+    @sk.setter
+    def sk(self, value: None | str) -> None:
+        self._sk = DynoKeyTemplate(value)
+
     def write(self, key: DynoKey, values: None | dict[str, any]) -> None | dict[str, dict[str, any]]:
         pval = self.format_pk(values)
         if pval is None:
@@ -85,55 +174,43 @@ class DynoKeyFormat:
         sval = self.format_sk(values)
         if sval is None:
             return None
-        results = {
-            key.pk: {key.pk_type.value: pval},
-            key.sk: {key.sk_type.value: sval},
-        }
-        return results
+        return key.key_item(pval, sval)
 
     def format_pk(self, values: None | dict[str, any] = None) -> None | str:
-        if self.pk is not None:
-            try:
-                value = self.pk.format(**(values or dict()))
-                if "None" in value:
-                    for check in self.req:
-                        if check not in values:
-                            return None
-                        if values[check] is None:
-                            return None
-                return value
-            except Exception as e:
-                pass
-        return None
+        return self._pk.format(values, self.req)
 
     def format_sk(self, values: None | dict[str, any] = None) -> None | str:
-        if self.sk is not None:
-            try:
-                value = self.sk.format(**(values or dict()))
-                if "None" in value:
-                    for check in self.req:
-                        if check not in values:
-                            return None
-                        if values[check] is None:
-                            return None
-                return value
-            except Exception as e:
-                pass
-        return None
+        return self._sk.format(values, self.req)
 
 
 class DynoGlobalIndexFormat:
-    __slots__ = ["name", "pk", "sk", "req"]
+    __slots__ = ["name", "_pk", "_sk", "req"]
 
     def __init__(self, name: str, pk: None | str = None, sk: None | str = None, req: None | set[str] = None):
         self.name = name
-        self.pk: str = pk
-        self.sk: str = sk
+        self._pk = DynoKeyTemplate(pk)
+        self._sk = DynoKeyTemplate(sk)
         self.req: set[str] = req or set[str]()
 
     def __repr__(self):
         return f"DynoGlobalIndexFormat.{self.name}: pk={self.pk}, sk={self.sk}, req={' '.join(self.req)}"
 
+    @property
+    def pk(self) -> None | str:
+        return self._pk.text
+
+    @pk.setter
+    def pk(self, value: None | str) -> None:
+        self._pk = DynoKeyTemplate(value)
+
+    @property
+    def sk(self) -> None | str:
+        return self._sk.text
+
+    @sk.setter
+    def sk(self, value: None | str) -> None:
+        self._sk = DynoKeyTemplate(value)
+
     def write(self, key: DynoKey, values: None | dict[str, any]) -> None | dict[str, dict[str, any]]:
         pval = self.format_pk(values)
         if pval is None:
@@ -148,34 +225,10 @@ class DynoGlobalIndexFormat:
         return results
 
     def format_pk(self, values: None | dict[str, any] = None) -> None | str:
-        if self.pk is not None:
-            try:
-                value = self.pk.format(**(values or dict()))
-                if "None" in value:
-                    for check in self.req:
-                        if check not in values:
-                            return None
-                        if values[check] is None:
-                            return None
-                return value
-            except Exception as e:
-                pass
-        return None
+        return self._pk.format(values, self.req)
 
     def format_sk(self, values: None | dict[str, any] = None) -> None | str:
-        if self.sk is not None:
-            try:
-                value = self.sk.format(**(values or dict()))
-                if "None" in value:
-                    for check in self.req:
-                        if check not in values:
-                            return None
-                        if values[check] is None:
-                            return None
-                return value
-            except Exception as e:
-                pass
-        return None
+        return self._sk.format(values, self.req)
 
 
 class DynoGlobalIndex:
@@ -224,6 +277,36 @@ class DynoGlobalIndex:
 class DynoSchema(metaclass=DynoMeta):
     Key: DynoKeyFormat = ...
     Indexes: list[DynoGlobalIndexFormat] = list[DynoGlobalIndexFormat]()
+    _attributes: MappingProxyType[str, DynoAttrBase] = MappingProxyType({})
+    _attributes_nested: MappingProxyType[str, DynoAttrBase] = MappingProxyType({})
+    _autoincrements: MappingProxyType[str, DynoAttribAutoIncrement] = MappingProxyType({})
+    _globalindexes: MappingProxyType[str, DynoGlobalIndexFormat] = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # the class body is fixed once declared, resolve the attribute lookups up front
+        attributes = dict[str, DynoAttrBase]()
+        nested = dict[str, DynoAttrBase]()
+        autoincrements = dict[str, DynoAttribAutoIncrement]()
+        for name, cls_attr in cls.__dict__.items():
+            if isinstance(cls_attr, DynoAttribAutoIncrement):
+                autoincrements[name] = cls_attr
+                continue
+            if not isinstance(cls_attr, DynoAttrBase):
+                continue
+
+            attributes[name] = cls_attr
+            nested[name] = cls_attr
+            if isinstance(cls_attr, (DynoAttrMap, DynoAttrList)):
+                for cn, cb in cls_attr.get_attributes().items():
+                    nested[f"{name}.{cn}"] = cb
+
+        cls._attributes = MappingProxyType(attributes)
+        cls._attributes_nested = MappingProxyType(nested)
+        cls._autoincrements = MappingProxyType(autoincrements)
+        cls._globalindexes = MappingProxyType(
+            {item.name: item for item in cls.Indexes if isinstance(item, DynoGlobalIndexFormat)})
 
     @classmethod
     def _class_repr(cls):
@@ -238,48 +321,20 @@ class DynoSchema(metaclass=DynoMeta):
         return cls.__name__
 
     @classmethod
-    def get_globalindexes(cls) -> dict[str, DynoGlobalIndexFormat]:
-        results = dict[str, DynoGlobalIndexFormat]()
-        for item in cls.Indexes:
-            if isinstance(item, DynoGlobalIndexFormat):
-                results[item.name] = item
-        return results
+    def get_globalindexes(cls) -> MappingProxyType[str, DynoGlobalIndexFormat]:
+        return cls._globalindexes
 
     @classmethod
     def get_globalindex(cls, name: str) -> None | DynoGlobalIndexFormat:
-        for item in cls.Indexes:
-            if isinstance(item, DynoGlobalIndexFormat) and item.name == name:
-                return item
-        return None
+        return cls._globalindexes.get(name)
 
     @classmethod
-    def get_attributes(cls, nested: bool = False) -> dict[str, DynoAttrBase]:
-        results = dict[str, DynoAttrBase]()
-        for name, cls_attr in cls.__dict__.items():
-            if isinstance(cls_attr, DynoAttrBase):
-                results[name] = cls_attr
-                if not nested:
-                    continue
-
-                if isinstance(cls_attr, DynoAttrMap):
-                    child = cls_attr.get_attributes()
-                    for cn, cb in child.items():
-                        results[f"{name}.{cn}"] = cb
-
-                if isinstance(cls_attr, DynoAttrList):
-                    child = cls_attr.get_attributes()
-                    for cn, cb in child.items():
-                        results[f"{name}.{cn}"] = cb
-
-        return results
+    def get_attributes(cls, nested: bool = False) -> MappingProxyType[str, DynoAttrBase]:
+        return cls._attributes_nested if nested else cls._attributes
 
     @classmethod
     def get_autoincrement(cls, name: str) -> None | DynoAttribAutoIncrement:
-        for autoinc_name, cls_attr in cls.__dict__.items():
-            if isinstance(cls_attr, DynoAttribAutoIncrement):
-                if autoinc_name == name:
-                    return cls_attr
-        return None
+        return cls._autoincrements.get(name)
 
 
 class DynoAllow:
@@ -304,6 +359,41 @@ class DynoTable(metaclass=DynoMeta):
     PayPerRequest = True
     ReadCapacityUnits: int = 1
     WriteCapacityUnits: int = 1
+    _schemas: MappingProxyType[str, type[DynoSchema]] = MappingProxyType({})
+    _globalindexes: MappingProxyType[str, DynoGlobalIndex] = MappingProxyType({})
+    _write_plans: dict[str, tuple[tuple[str, Callable[[any], any], bool, bool], ...]] = dict()
+    _links: dict[tuple[None | type[DynoSchema], None | str], DynoTableLink] = dict()
+    _unique_conditions: tuple[tuple[str, str], ...] = tuple()
+    _datetime_attributes: frozenset[str] = frozenset()
+    _key_conditions: tuple[str, str] = ("", "")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        schemas = dict[str, type[DynoSchema]]()
+        for name, cls_attr in cls.__dict__.items():
+            if inspect.isclass(cls_attr) and issubclass(cls_attr, DynoSchema):
+                schemas[name] = cls_attr
+        cls._schemas = MappingProxyType(schemas)
+        cls._globalindexes = MappingProxyType(
+            {item.name: item for item in cls.Indexes if isinstance(item, DynoGlobalIndex)})
+        cls._write_plans = dict()
+        cls._links = dict()
+        # unique gsi keys and their write guard, fixed once the indexes are declared
+        cls._unique_conditions = tuple(
+            (name, f"attribute_not_exists({name})")
+            for gsi in cls._globalindexes.values() if gsi.unique
+            for name in (gsi.pk, gsi.sk))
+        # primary key guards for writes that require the item to exist or to be new
+        if isinstance(cls.Key, DynoKey):
+            cls._key_conditions = (
+                f"attribute_exists({cls.Key.pk}) AND attribute_exists({cls.Key.sk})",
+                f"attribute_not_exists({cls.Key.pk}) AND attribute_not_exists({cls.Key.sk})")
+        # top level datetime attributes of every schema, the candidates for time to live
+        cls._datetime_attributes = frozenset(
+            name
+            for schema in schemas.values()
+            for name, attrib in schema.get_attributes().items() if isinstance(attrib, DynoAttrDateTime))
 
     @classmethod
     def isvalid(cls) -> bool:
@@ -362,7 +452,11 @@ class DynoTable(metaclass=DynoMeta):
 
     @classmethod
     def get_link(cls, schema: type[DynoSchema] | None = None, globalindex: None | str = None) -> DynoTableLink:
-        return DynoTableLink(cls, schema, globalindex)
+        # links are read-only descriptions of (table, schema, gsi), one shared instance per combination
+        link = cls._links.get((schema, globalindex))
+        if link is None:
+            link = cls._links.setdefault((schema, globalindex), DynoTableLink(cls, schema, globalindex))
+        return link
 
     @classmethod
     def auto_increment(cls,
@@ -390,6 +484,8 @@ class DynoTable(metaclass=DynoMeta):
         # prepare the key
         #
         pk = schema.Key.format_pk(data)
+        # counter rows have always been stored under the pk template in both key positions,
+        # changing that would move existing counters to a new item and restart their sequences
         sk = schema.Key.format_pk(data)
         if pk is None or sk is None:
             raise Exception(f"Invalid key for {schema}.{name}")
@@ -408,10 +504,7 @@ class DynoTable(metaclass=DynoMeta):
 
         params = {
             "TableName": cls.TableName,
-            "Key": {
-                cls.Key.pk: {cls.Key.pk_type.value: pk},
-                cls.Key.sk: {cls.Key.sk_type.value: sk}
-            },
+            "Key": cls.Key.key_item(pk, sk),
             "UpdateExpression": "SET #n1 = :v1 + :v2" if reset else "SET #n1 = if_not_exists(#n1, :v1) + :v2",
             "ExpressionAttributeNames": names,
             "ExpressionAttributeValues": values,
@@ -478,34 +571,32 @@ class DynoTable(metaclass=DynoMeta):
         return params
 
     @classmethod
-    def get_globalindexes(cls) -> dict[str, DynoGlobalIndex]:
-        indexes = dict[str, DynoGlobalIndex]()
-        for item in cls.Indexes:
-            if isinstance(item, DynoGlobalIndex):
-                indexes[item.name] = item
-        return indexes
+    def get_globalindexes(cls) -> MappingProxyType[str, DynoGlobalIndex]:
+        return cls._globalindexes
 
     @classmethod
     def get_globalindex(cls, name: str) -> None | DynoGlobalIndex:
-        for item in cls.Indexes:
-            if isinstance(item, DynoGlobalIndex) and item.name == name:
-                return item
-        return None
+        return cls._globalindexes.get(name)
 
     @classmethod
-    def get_schemas(cls) -> dict[str, type[DynoSchema]]:
-        results = dict[str, type[DynoSchema]]()
-        for name, cls_attr in cls.__dict__.items():
-            if inspect.isclass(cls_attr) and issubclass(cls_attr, DynoSchema):
-                results[name] = cls_attr
-        return results
+    def get_schemas(cls) -> MappingProxyType[str, type[DynoSchema]]:
+        return cls._schemas
+
+    @classmethod
+    def get_unique_conditions(cls) -> tuple[tuple[str, str], ...]:
+        return cls._unique_conditions
+
+    @classmethod
+    def get_key_condition(cls, exists: bool) -> str:
+        return cls._key_conditions[0 if exists else 1]
+
+    @classmethod
+    def get_datetime_attributes(cls) -> frozenset[str]:
+        return cls._datetime_attributes
 
     @classmethod
     def get_schema(cls, name: str) -> type[DynoSchema] | None:
-        for n, cls_attr in cls.__dict__.items():
-            if inspect.isclass(cls_attr) and issubclass(cls_attr, DynoSchema) and n == name:
-                return cls_attr
-        return None
+        return cls._schemas.get(name)
 
     @classmethod
     def allow_list(cls, schema: type[DynoSchema], globalindex: None | str = None) -> dict[str, DynoAllow]:
@@ -535,6 +626,20 @@ class DynoTable(metaclass=DynoMeta):
 
         return result
 
+    @classmethod
+    def _write_plan(cls, schema: type[DynoSchema]) -> tuple[tuple[str, Callable[[any], any], bool, bool], ...]:
+        # (name, writer, readonly, always) per schema attribute, built on first write
+        name = schema.get_schema_name()
+        plan = cls._write_plans.get(name)
+        if plan is None:
+            plan = tuple(
+                (attr_name, item.attrib.write_value, item.attrib.readonly, item.attrib.always)
+                for attr_name, item in cls.allow_list(schema).items()
+                if isinstance(item.attrib, DynoAttrBase)
+            )
+            cls._write_plans[name] = plan
+        return plan
+
     @classmethod
     def write_value(cls,
                     data: dict[str, any],
@@ -542,7 +647,7 @@ class DynoTable(metaclass=DynoMeta):
                     globalindex: None | str = None,
                     include_readonly: None | bool = None
                     ) -> dict[str, any]:
-        allow = cls.allow_list(schema, globalindex)
+        plan = cls._write_plan(schema)
         result = dict[str, any]()
         include_readonly = include_readonly if isinstance(include_readonly, bool) else False
 
@@ -555,21 +660,18 @@ class DynoTable(metaclass=DynoMeta):
         #
         # write attributes
         #
-        for name, item in allow.items():
-            if isinstance(item.attrib, DynoAttrBase):
-                if item.attrib.readonly and not include_readonly:
-                    # respect readonly when asked to
-                    continue
-                if not item.attrib.always and name not in data:
-                    # if the entry is unknown and the member is optional, skip it
-                    continue
-
-                try:
-                    value = data.get(name)
-                    ret = item.attrib.write_value(value)
-                    result[name] = ret
-                except Exception as e:
-                    logger.exception(f"DynoTable.write_value(include_readonly={include_readonly}): {e!r}")
+        for name, writer, readonly, always in plan:
+            if readonly and not include_readonly:
+                # respect readonly when asked to
+                continue
+            if not always and name not in data:
+                # if the entry is unknown and the member is optional, skip it
+                continue
+
+            try:
+                result[name] = writer(data.get(name))
+            except Exception as e:
+                logger.exception(f"DynoTable.write_value(include_readonly={include_readonly}): {e!r}")
 
         if schema is None:
             return result
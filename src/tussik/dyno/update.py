@@ -8,6 +8,8 @@ from .table import DynoTable, DynoTableLink, DynoSchema
 
 logger = logging.getLogger()
 
+_NULL = DynoEnum.Null.value
+
 
 class DynoExpressionEnum(str, Enum):
     Add = "ADD"
@@ -155,7 +157,7 @@ class DynoUpdate:
         if isinstance(dataset, set):
             data = dict()
             for item in dataset:
-                data[item] = {DynoEnum.Null.value: True}
+                data[item] = {_NULL: True}
             self._extract(DynoExpressionEnum.Set.value, data)
         elif isinstance(dataset, dict):
             self._extract(DynoExpressionEnum.Set.value, dataset)
@@ -164,7 +166,7 @@ class DynoUpdate:
         if isinstance(dataset, list):
             data = dict()
             for item in dataset:
-                data[item] = {DynoEnum.Null.value: True}
+                data[item] = {_NULL: True}
             self._extract(DynoExpressionEnum.Remove.value, data)
         elif isinstance(dataset, dict):
             self._extract(DynoExpressionEnum.Remove.value, dataset)
@@ -173,13 +175,13 @@ class DynoUpdate:
         if isinstance(dataset, list):
             data = dict()
             for item in dataset:
-                data[item] = {DynoEnum.Null.value: True}
+                data[item] = {_NULL: True}
             self._extract(DynoExpressionEnum.Delete.value, data)
         elif isinstance(dataset, dict):
             self._extract(DynoExpressionEnum.Delete.value, dataset)
 
     def _extract(self, action: str, dataset: dict[str, dict], prefix: None | str = None) -> None:
-        avail = self._schema_obj.get_attributes(nested=True)  # TODO: cache
+        avail = self._schema_obj.get_attributes(nested=True)
         for k, v in dataset.items():
             key = k if prefix is None else f"{prefix}.{k}"
 
@@ -238,10 +240,7 @@ class DynoUpdate:
         # Table and Key
         #
         params['TableName'] = self._link.table.TableName
-        params['Key'] = {
-            self._link.table.Key.pk: {self._link.table.Key.pk_type.value: self._pk},
-            self._link.table.Key.sk: {self._link.table.Key.sk_type.value: self._sk}
-        }
+        params['Key'] = self._link.table.Key.key_item(self._pk, self._sk)
 
         #
         # add all always include read only attributes
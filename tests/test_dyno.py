@@ -1,8 +1,11 @@
 """Test for connecting"""
+import contextlib
 from enum import Enum
 
+from botocore.stub import Stubber
+
 from tussik.dyno import *
-from tussik.dyno.attributes import DynoAttribAutoIncrement
+from tussik.dyno.attributes import DynoAttrBase, DynoAttribAutoIncrement
 from tussik.dyno.query import DynoQuery, DynoQuerySelectEnum
 from tussik.dyno.table import DynoGlobalIndexFormat
 
@@ -83,6 +86,31 @@ SampleTable.isvalid()
 DynoConnect.set_host()
 
 
+def stub_connect() -> DynoConnect:
+    # stubbed calls never leave the process, the explicit region and keys keep boto3 from looking elsewhere
+    return DynoConnect(host="http://localhost:8000", access="test", secret="test", region="us-east-1")
+
+
+@contextlib.contextmanager
+def capture_params(db: DynoConnect, operation: str):
+    calls = []
+
+    def capture(params, **kwargs):
+        calls.append(params)
+
+    event = f"before-parameter-build.dynamodb.{operation}"
+    db.client().meta.events.register(event, capture)
+    try:
+        yield calls
+    finally:
+        db.client().meta.events.unregister(event, capture)
+
+
+def encode_rows(rows: list[dict], schema: type[DynoSchema]) -> list[dict]:
+    return [DynoReader(SampleTable.write_value(row, schema, include_readonly=True)).encode(SampleTable, schema)
+            for row in rows]
+
+
 class TestDyno:
     def test_create_table(self) -> None:
         db = DynoConnect()
@@ -122,6 +150,19 @@ class TestDyno:
         y = SampleTable.get_link(SampleTable.User, "gsi1")
         assert y
 
+    def test_key_format(self):
+        fmt = SampleTable.User.Key
+        assert fmt.format_pk() == "account#user#"
+        assert fmt.format_sk({"accountid": "AAA", "userid": 12}) == "accountid#AAA#user#12"
+        assert fmt.format_sk({"accountid": "AAA"}) is None
+
+        fmt = SampleTable.Account.Key
+        assert fmt.format_sk({"accountid": None}) is None
+        assert fmt.format_sk({"accountid": "AAA"}) == "accountid#AAA"
+
+        fmt = DynoKeyFormat(pk="account#", sk="accountid#{accountid:>4}", req={"accountid"})
+        assert fmt.format_sk({"accountid": "A"}) == "accountid#   A"
+
     def test_initalize_values(self):
         data = {
             "address": {
@@ -304,6 +345,17 @@ class TestDyno:
 
         assert True
 
+    def test_reader_single_key_map(self):
+        item = {"accountid": {"S": "xsdd"}, "address": {"city": "smallville"}}
+        reader = DynoReader(item)
+        assert reader.dataset == {"accountid": "xsdd", "address": {"city": "smallville"}}
+
+    def test_datetime_attributes(self):
+        names = SampleTable.get_datetime_attributes()
+        assert "created" in names
+        assert "modified" in names
+        assert "alias" not in names
+
     def test_update(self):
         db = DynoConnect()
 
@@ -387,4 +439,195 @@ class TestDyno:
         assert current_age + 5 == new_age
         assert len(new_tags) == 5
 
-
+    def test_put_many_chunks(self, monkeypatch):
+        monkeypatch.setattr("tussik.dyno.connects._backoff", lambda attempt: None)
+        db = stub_connect()
+        rows = [{"accountid": "A", "userid": f"u{i}", "email": f"e{i}"} for i in range(30)]
+        with capture_params(db, "BatchWriteItem") as calls, Stubber(db.client()) as stubber:
+            stubber.add_response("batch_write_item", {})
+            stubber.add_response("batch_write_item", {})
+            dr = db.put_many(rows, SampleTable, SampleTable.User)
+            stubber.assert_no_pending_responses()
+        assert dr.ok
+        assert dr.count == 30
+        assert [len(call["RequestItems"]["sample"]) for call in calls] == [25, 5]
+
+    def test_put_many_retry_unprocessed(self, monkeypatch):
+        monkeypatch.setattr("tussik.dyno.attributes.time.time", lambda: 1700000000)
+        sleeps = []
+        monkeypatch.setattr("tussik.dyno.connects._backoff", sleeps.append)
+        db = stub_connect()
+        rows = [{"accountid": "A", "userid": f"u{i}", "email": f"e{i}"} for i in range(3)]
+        retry = {"sample": [{"PutRequest": {"Item": encode_rows(rows, SampleTable.User)[1]}}]}
+        with capture_params(db, "BatchWriteItem") as calls, Stubber(db.client()) as stubber:
+            stubber.add_response("batch_write_item", {"UnprocessedItems": retry})
+            stubber.add_response("batch_write_item", {})
+            dr = db.put_many(rows, SampleTable, SampleTable.User)
+        assert dr.ok
+        assert dr.count == 3
+        assert calls[1]["RequestItems"] == retry
+        assert len(sleeps) == 1
+
+    def test_put_many_unprocessed_remain(self, monkeypatch):
+        monkeypatch.setattr("tussik.dyno.attributes.time.time", lambda: 1700000000)
+        sleeps = []
+        monkeypatch.setattr("tussik.dyno.connects._backoff", sleeps.append)
+        db = stub_connect()
+        rows = [{"accountid": "A", "userid": f"u{i}", "email": f"e{i}"} for i in range(27)]
+        retry = {"sample": [{"PutRequest": {"Item": encode_rows(rows, SampleTable.User)[26]}}]}
+        with Stubber(db.client()) as stubber:
+            stubber.add_response("batch_write_item", {})
+            for attempt in range(5):
+                stubber.add_response("batch_write_item", {"UnprocessedItems": retry})
+            dr = db.put_many(rows, SampleTable, SampleTable.User)
+            stubber.assert_no_pending_responses()
+        assert not dr.ok
+        assert dr.code == 503
+        assert [row["userid"] for row in dr.data] == [f"u{i}" for i in range(26)]
+        assert dr.count == 26
+        assert len(sleeps) == 4
+
+    def test_auto_increment_throttled_then_success(self, monkeypatch):
+        waits = []
+        monkeypatch.setattr("tussik.dyno.connects._backoff", waits.append)
+        db = stub_connect()
+        with Stubber(db.client()) as stubber:
+            stubber.add_client_error("update_item", "ProvisionedThroughputExceededException")
+            stubber.add_response("update_item", {"Attributes": {"next_accountid": {"N": "7"}}})
+            value = db.auto_increment(dict(), SampleTable, SampleTable.AutoIncrement, "next_accountid")
+            stubber.assert_no_pending_responses()
+        assert value == 7
+        assert waits == [0]
+
+    def test_auto_increment_throttle_exhausted(self, monkeypatch, caplog):
+        waits = []
+        monkeypatch.setattr("tussik.dyno.connects._backoff", waits.append)
+        db = stub_connect()
+        with Stubber(db.client()) as stubber:
+            for _ in range(4):
+                stubber.add_client_error("update_item", "ProvisionedThroughputExceededException")
+            value = db.auto_increment(dict(), SampleTable, SampleTable.AutoIncrement, "next_accountid")
+            stubber.assert_no_pending_responses()
+        assert value is None
+        assert waits == [0, 1, 2]
+        assert "still throttled after 4 attempts" in caplog.text
+
+    def test_auto_increment_creates_counter(self):
+        db = stub_connect()
+        with Stubber(db.client()) as stubber:
+            stubber.add_client_error("update_item", "ConditionalCheckFailedException")
+            stubber.add_response("put_item", {})
+            stubber.add_response("update_item", {"Attributes": {"next_accountid": {"N": "1"}}})
+            value = db.auto_increment(dict(), SampleTable, SampleTable.AutoIncrement, "next_accountid")
+            stubber.assert_no_pending_responses()
+        assert value == 1
+
+    def test_scan_all_segments(self):
+        db = stub_connect()
+        pages = [[{"pk": {"S": "account#"}, "sk": {"S": f"accountid#{segment}{i}"}} for i in range(2)]
+                 for segment in range(3)]
+        with capture_params(db, "Scan") as calls, Stubber(db.client()) as stubber:
+            for page in pages:
+                stubber.add_response("scan", {"Items": page, "Count": 2, "ScannedCount": 2})
+            dr = db.scan_all(DynoQuery(SampleTable), segments=3)
+            stubber.assert_no_pending_responses()
+        assert dr.ok
+        assert sorted(call["Segment"] for call in calls) == [0, 1, 2]
+        assert {call["TotalSegments"] for call in calls} == {3}
+        assert dr.count == 6
+        assert dr.scanned == 6
+        assert sorted(item["sk"] for item in dr.data) == sorted(f"accountid#{s}{i}" for s in range(3) for i in range(2))
+
+    def test_scan_all_limit_is_total(self):
+        db = stub_connect()
+        page = [{"pk": {"S": "account#"}, "sk": {"S": f"accountid#{i}"}} for i in range(2)]
+        with Stubber(db.client()) as stubber:
+            for segment in range(2):
+                stubber.add_response("scan", {"Items": page, "LastEvaluatedKey": page[-1]})
+            dr = db.scan_all(DynoQuery(SampleTable, limit=2), segments=2)
+            stubber.assert_no_pending_responses()
+        assert dr.ok
+        assert dr.count == 2
+
+    def test_scan_all_bounds_segments(self):
+        db = stub_connect()
+        assert db.scan_all(DynoQuery(SampleTable), segments=0).code == 400
+        assert db.scan_all(DynoQuery(SampleTable), segments=1000).code == 400
+
+    def test_client_cache(self):
+        dc = stub_connect()
+        first = dc.client()
+        assert dc.client() is first
+        assert stub_connect().client() is not first
+
+    def test_delete_item_sends_key(self):
+        db = stub_connect()
+        expected = {
+            "TableName": "sample",
+            "Key": {"pk": {"S": "account#"}, "sk": {"S": "accountid#A"}},
+            "ReturnValues": "ALL_OLD",
+            "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+        }
+        deleted = {"pk": {"S": "account#"}, "sk": {"S": "accountid#A"}, "accountid": {"S": "A"}}
+        with Stubber(db.client()) as stubber:
+            stubber.add_response("delete_item", {"Attributes": deleted, "ResponseMetadata": {"HTTPStatusCode": 200}},
+                                 expected)
+            stubber.add_response("delete_item", {"ResponseMetadata": {"HTTPStatusCode": 200}}, expected)
+            stubber.add_response("delete_item", {"ResponseMetadata": {"HTTPStatusCode": 500}}, expected)
+            dr1 = db.delete_item({"accountid": "A", "alias": "skip"}, SampleTable, SampleTable.Account)
+            dr2 = db.delete_item({"accountid": "A"}, SampleTable, SampleTable.Account)
+            dr3 = db.delete_item({"accountid": "A"}, SampleTable, SampleTable.Account)
+            stubber.assert_no_pending_responses()
+        assert dr1.ok and dr1.code == 200
+        assert dr1.data["accountid"] == "A"
+        assert dr2.ok and dr2.code == 200
+        assert dr2.data == []
+        assert not dr3.ok
+        assert dr3.code == 500
+
+    def test_null_encoding_is_fresh(self):
+        attrib = DynoAttrString()
+        first = attrib.write_encode(None)
+        first["S"] = "changed"
+        assert attrib.write_encode(None) == {"NULL": True}
+
+    def test_number_list_write_value(self):
+        class NumberList(DynoAttrBase):
+            code = DynoEnum.NumberList.value
+
+        assert NumberList().write_value([0, 0.0, 1, 2.5, True, "3", None]) == [0, 0.0, 1, 2.5]
+
+    def test_member_errors_logged_once(self, caplog):
+        class Inner(DynoAttrMap):
+            n = DynoAttrIntList()
+
+        class Rows(DynoAttrList):
+            inner = Inner()
+            ages = DynoAttrIntList()
+
+        rows = Rows().read("L", [{"inner": {"M": {"k": {"n": {"S": "x"}}}}, "ages": {"S": "bad"}}])
+        assert rows == [{"inner": {"k": {}}}]
+        maps = [record.getMessage() for record in caplog.records if "DynoAttrMap.read" in record.getMessage()]
+        assert len(maps) == 1
+        assert "('k', 'n', ValueError(" in maps[0]
+        assert "DynoAttrList.read: 1 member errors" in caplog.text
+
+    def test_decode_keeps_integer_precision(self):
+        row = DynoReader({"age": {"N": "-9007199254740993"}}).decode(SampleTable, SampleTable.User)
+        assert row["age"] == -9007199254740993
+        row = DynoReader({"age": {"N": "-2.5e1"}}).decode(SampleTable, SampleTable.User)
+        assert row["age"] == -25
+
+    def test_allow_list_is_read_only(self):
+        allowlist = DynoReader(dict()).allow_list(SampleTable, SampleTable.Account)
+        rejected = False
+        try:
+            allowlist["pk"] = DynoEnum.Number
+        except TypeError:
+            rejected = True
+        assert rejected
+        assert DynoReader(dict()).allow_list(SampleTable, SampleTable.Account)["pk"] == DynoEnum.String
+
+    def test_auto_increment_key_layout(self):
+        params = SampleTable.auto_increment({"accountid": "A"}, SampleTable.Account, "next_userid")
+        assert params["Key"] == {"pk": {"S": "account#"}, "sk": {"S": "account#"}}